@@ -0,0 +1,323 @@
+"""
+A module implementing interfaces for running runtimepy applications in this
+process (from configuration data that's already in memory).
+"""
+
+# built-in
+from argparse import Namespace as _Namespace
+import asyncio
+from copy import deepcopy
+from functools import partial
+from queue import SimpleQueue
+from site import addsitedir
+import sys
+from threading import Thread
+from typing import Any, Awaitable, Callable, Iterable, Optional, cast
+
+# third-party
+from runtimepy import DEFAULT_EXT
+from runtimepy.commands.common import curses_wrap_if
+from runtimepy.net.arbiter import ConnectionArbiter
+from runtimepy.net.arbiter.config import handle_config_builders
+from runtimepy.net.arbiter.config.codec import ConnectionArbiterConfig
+from runtimepy.net.connection import Connection
+from runtimepy.tui.channels import CursesWindow
+from vcorelib.asyncio import run_handle_stop
+from vcorelib.dict import merge
+from vcorelib.io import ARBITER
+from vcorelib.io.types import JsonObject
+from vcorelib.logging import LoggerMixin
+from vcorelib.paths import find_file, normalize
+
+
+class DataConnectionArbiter(ConnectionArbiter):
+    """
+    A connection arbiter that runs an application from configuration data
+    that's already loaded (see 'load'), and can limit how many deferred
+    connections are opened at once.
+    """
+
+    def __init__(
+        self, *args: Any, data: Optional[JsonObject] = None, **kwargs: Any
+    ) -> None:
+        """Initialize this instance."""
+
+        super().__init__(*args, **kwargs)
+        self.data: JsonObject = data or {}
+
+        # The maximum number of deferred connections opened at once (set by
+        # the 'connect_limit' app config, 0 for no limit).
+        self.connect_limit = 0
+
+    async def process_config(
+        self, config: ConnectionArbiterConfig, wait_for_stop: bool = False
+    ) -> None:
+        """Process this instance's (already loaded) configuration data."""
+
+        # Update in place, so that the application's root configuration is
+        # this instance's data.
+        config.data.update(self.data)
+
+        app_config = cast(JsonObject, config.data.get("config") or {})
+        self.connect_limit = cast(int, app_config.get("connect_limit", 0))
+
+        await super().process_config(
+            ConnectionArbiterConfig(data=config.data),
+            wait_for_stop=wait_for_stop,
+        )
+
+    async def _open_deferred(
+        self,
+        name: str,
+        connection: Awaitable[Connection],
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[Connection]:
+        """Open a deferred connection (once the semaphore is acquired)."""
+
+        async with semaphore:
+            # Connection factories raise assertion errors after retrying.
+            try:
+                return await connection
+            except (AssertionError, OSError) as exc:
+                self.logger.warning("Couldn't open '%s': %s.", name, exc)
+
+        return None
+
+    async def _init_connections(self) -> None:
+        """
+        Initialize network connections. With a connection limit, deferred
+        connections that can't be opened are skipped (so that one unreachable
+        endpoint doesn't stop the application).
+        """
+
+        if self.connect_limit > 0:
+            semaphore = asyncio.Semaphore(self.connect_limit)
+
+            deferred = self._deferred_connections
+            self._deferred_connections = {}
+
+            for name, conn in zip(
+                deferred,
+                await asyncio.gather(
+                    *(
+                        self._open_deferred(name, conn, semaphore)
+                        for name, conn in deferred.items()
+                    )
+                ),
+            ):
+                if conn is not None:
+                    self._register_connection(conn, name)
+
+        await super()._init_connections()
+
+
+def load(
+    configs: Iterable[str], data: Optional[JsonObject] = None
+) -> JsonObject:
+    """
+    Load configuration files (and data) as a single configuration, the same
+    way an arbiter loads configuration files.
+    """
+
+    logger = LoggerMixin(logger_name=__name__)
+
+    # Included files are loaded after the other configuration files.
+    data = deepcopy(data or {})
+    includes: list[str] = data.pop("includes", [])  # type: ignore
+    paths = list(configs) + includes
+
+    loaded = set()
+
+    result: JsonObject = {}
+    for path in paths:
+        found = find_file(path, logger=logger.logger, include_cwd=True)
+
+        # Try the package search path next.
+        if found is None:
+            for pkg in ConnectionArbiter.search_packages:
+                found = find_file(
+                    f"{path}.{DEFAULT_EXT}", logger=logger.logger, package=pkg
+                )
+                if found is not None:
+                    break
+
+        if found is None:
+            raise FileNotFoundError(f"Couldn't find '{path}'!")
+
+        # Only load files once.
+        absolute = found.resolve()
+        if absolute not in loaded:
+            merge(
+                result,
+                ARBITER.decode(
+                    found,
+                    includes_key="includes",
+                    require_success=True,
+                    logger=logger.logger,
+                ).data,
+                logger=logger.logger,
+            )
+            loaded.add(absolute)
+
+    merge(result, data, logger=logger.logger)
+
+    # Add the working directory and parent directories for module loading
+    # (e.g. configuration builders).
+    directories = set(str(normalize(x).parent) for x in paths)
+    directories.add(
+        str(result.setdefault("directory", str(normalize(".").resolve())))
+    )
+    for directory in directories:
+        addsitedir(directory)
+        if directory not in sys.path:
+            sys.path.append(directory)
+
+    # Configuration builders run on the complete configuration (including
+    # in-memory data).
+    handle_config_builders(result, logger)
+
+    return result
+
+
+class MainThread:
+    """
+    Runs an application in its own thread, and methods that the application
+    hands over (e.g. an interactive user interface, which can only run on the
+    main thread) on the main thread.
+    """
+
+    # The instance running an application (if any).
+    active: Optional["MainThread"] = None
+
+    def __init__(self, stop_sig: asyncio.Event) -> None:
+        """Initialize this instance."""
+
+        self.stop_sig = stop_sig
+        self.methods: SimpleQueue[Optional[Callable[[], None]]] = SimpleQueue()
+
+        # The application's event loop (once it's running).
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(self, method: Callable[[], None]) -> None:
+        """Run a method on the main thread (from any thread)."""
+        self.methods.put(method)
+
+    def stop(self) -> None:
+        """Set the application's stop signal (from any thread)."""
+
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.stop_sig.set)
+
+    def run(self, app: Callable[[], int]) -> int:
+        """
+        Run an application in its own thread (and handed-over methods on this
+        thread) until it stops.
+        """
+
+        result = [1]
+
+        def target() -> None:
+            """Run the application."""
+
+            try:
+                result[0] = app()
+            finally:
+                self.methods.put(None)
+
+        MainThread.active = self
+        thread = Thread(target=target, name="arbiter")
+        thread.start()
+
+        try:
+            while True:
+                try:
+                    method = self.methods.get()
+                    if method is None:
+                        break
+                    method()
+                except KeyboardInterrupt:
+                    print("Keyboard interrupt.")
+                    self.stop()
+
+            thread.join()
+        finally:
+            MainThread.active = None
+
+        return result[0]
+
+
+async def entry(
+    stop_sig: asyncio.Event,
+    config: JsonObject,
+    wait_for_stop: bool = False,
+    poller: bool = True,
+    window: CursesWindow = None,
+) -> int:
+    """Run an application from loaded configuration data (see 'load')."""
+
+    if MainThread.active is not None:
+        MainThread.active.loop = asyncio.get_running_loop()
+
+    arbiter = DataConnectionArbiter(
+        stop_sig=stop_sig,
+        window=window,
+        metrics_poller_task=poller,
+        data=config,
+    )
+
+    # No configuration files are loaded (the configuration is already
+    # loaded).
+    await arbiter.load_configs([], wait_for_stop=wait_for_stop)
+
+    return await arbiter.app()
+
+
+def run(
+    configs: Iterable[str],
+    data: Optional[JsonObject] = None,
+    init_only: bool = False,
+    wait_for_stop: bool = False,
+    poller: bool = True,
+    uvloop: bool = True,
+    curses: bool = False,
+) -> int:
+    """
+    Run an application (in this process) from configuration files and data,
+    with an optional curses window.
+    """
+
+    stop_sig = asyncio.Event()
+
+    if init_only:
+        stop_sig.set()
+
+    # Configuration is loaded ahead of time, to determine which thread the
+    # application runs on.
+    config = load(configs, data)
+    app_config = cast(JsonObject, config.get("config") or {})
+
+    def app(args: _Namespace) -> int:
+        """Run the application."""
+
+        return run_handle_stop(
+            stop_sig,
+            entry(
+                stop_sig,
+                config,
+                wait_for_stop=wait_for_stop,
+                poller=poller,
+                window=args.window,
+            ),
+            enable_uvloop=uvloop,
+        )
+
+    # An interactive user interface that runs in its own thread runs on the
+    # main thread (and the rest of the application runs in its own thread).
+    if (
+        not curses
+        and app_config.get("ui_thread")
+        and not app_config.get("headless")
+    ):
+        return MainThread(stop_sig).run(partial(app, _Namespace(window=None)))
+
+    return curses_wrap_if(app, _Namespace(curses=curses))
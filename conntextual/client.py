@@ -4,20 +4,138 @@ A module implementing conntextual client interfaces.
 
 # built-in
 from argparse import ArgumentParser as _ArgumentParser
+from argparse import ArgumentTypeError as _ArgumentTypeError
 from argparse import Namespace as _Namespace
-from typing import Any
+from pathlib import Path
+from typing import Any, List, NamedTuple
 
 # third-party
 from runtimepy.commands.common import arbiter_args
 
+# internal
+from conntextual.util import css_name
+
+# The default number of connections that are opened at once.
+DEFAULT_CONNECT_LIMIT = 8
+
+
+class Endpoint(NamedTuple):
+    """A remote endpoint to connect to."""
+
+    host: str
+    port: int
+
+    @property
+    def name(self) -> str:
+        """The name of this endpoint's connection."""
+        return f"{self.host}:{self.port}"
+
+    @staticmethod
+    def decode(value: str) -> "Endpoint":
+        """Create an endpoint from a 'host:port' string."""
+
+        host, sep, port = value.strip().rpartition(":")
+        if not sep or not host or not port.isdigit() or int(port) > 0xFFFF:
+            raise ValueError(f"Invalid endpoint '{value}' (not host:port)!")
+        return Endpoint(host, int(port))
+
+
+def endpoint_arg(value: str) -> Endpoint:
+    """Decode an endpoint command-line argument."""
+
+    try:
+        return Endpoint.decode(value)
+    except ValueError as exc:
+        raise _ArgumentTypeError(str(exc)) from exc
+
+
+def read_endpoints(path: Path) -> List[Endpoint]:
+    """
+    Read endpoints from a file ('host:port' per line, blank lines and '#'
+    comments are ignored).
+    """
+
+    result = []
+
+    with path.open(encoding="utf-8") as path_fd:
+        for line in path_fd:
+            line = line.split("#", maxsplit=1)[0].strip()
+            if line:
+                result.append(Endpoint.decode(line))
+
+    return result
+
+
+def endpoints(args: _Namespace) -> List[Endpoint]:
+    """Get endpoints to connect to based on command-line arguments."""
+
+    result = []
+
+    if args.host is not None:
+        if args.port is None:
+            raise ValueError(f"No port for host '{args.host}'!")
+        result.append(Endpoint(args.host, args.port))
+
+    result.extend(args.endpoint)
+
+    if args.endpoints is not None:
+        result.extend(read_endpoints(args.endpoints))
+
+    # Connect to each endpoint once.
+    return list(dict.fromkeys(result))
+
+
+def connection_names(targets: List[Endpoint]) -> List[str]:
+    """
+    Get connection names for endpoints. Names that would have the same
+    identifier value (see 'css_name', e.g. 'a.b:1' and 'a_b:1') get a suffix.
+    """
+
+    result = []
+    idents: set[str] = set()
+
+    for endpoint in targets:
+        name = endpoint.name
+        suffix = 1
+        while css_name(name) in idents:
+            suffix += 1
+            name = f"{endpoint.name}-{suffix}"
+
+        idents.add(css_name(name))
+        result.append(name)
+
+    return result
+
 
 def client_args(
     parser: _ArgumentParser, default_factory: str = "tcp_json"
 ) -> None:
     """Add command-line argument options for servers."""
 
-    parser.add_argument("host", help="hostname to connect to")
-    parser.add_argument("port", type=int, help="port to connect to")
+    parser.add_argument("host", nargs="?", help="hostname to connect to")
+    parser.add_argument("port", nargs="?", type=int, help="port to connect to")
+    parser.add_argument(
+        "-e",
+        "--endpoint",
+        action="append",
+        default=[],
+        type=endpoint_arg,
+        help="an additional endpoint to connect to (host:port)",
+    )
+    parser.add_argument(
+        "--endpoints",
+        type=Path,
+        help="a file of endpoints to connect to (host:port per line)",
+    )
+    parser.add_argument(
+        "--connect-limit",
+        type=int,
+        default=DEFAULT_CONNECT_LIMIT,
+        help=(
+            "maximum number of connections to open at once "
+            "(default: %(default)d)"
+        ),
+    )
     parser.add_argument(
         "-f",
         "--factory",
@@ -30,17 +148,33 @@ def client_args(
 
 
 def client_config(args: _Namespace) -> dict[str, Any]:
-    """Get a server configuration based on command-line arguments."""
+    """
+    Get a client configuration based on command-line arguments. A single
+    endpoint's connection is named 'client', otherwise connections are named
+    after their endpoints (and opened concurrently, see 'connect_limit').
+    """
 
-    result = {
+    targets = endpoints(args)
+    if not targets:
+        raise ValueError("No endpoints to connect to!")
+
+    single = len(targets) == 1
+
+    clients = [
+        {
+            "name": "client" if single else name,
+            "factory": args.factory,
+            "defer": not single,
+            "kwargs": {"host": endpoint.host, "port": endpoint.port},
+        }
+        for name, endpoint in zip(connection_names(targets), targets)
+    ]
+
+    return {
         "includes": ["package://runtimepy/factories.yaml"],
-        "clients": [
-            {
-                "name": "client",
-                "factory": args.factory,
-                "kwargs": {"host": args.host, "port": args.port},
-            }
-        ],
+        "clients": clients,
+        "config": {
+            "connect_limit": args.connect_limit,
+            "remote_connections": [x["name"] for x in clients],
+        },
     }
-
-    return result
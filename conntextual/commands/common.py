@@ -5,12 +5,38 @@ A module implementing shared argument parsing interfaces.
 # built-in
 from argparse import ArgumentParser as _ArgumentParser
 from argparse import Namespace as _Namespace
-from typing import List
+from typing import List, Optional
 
 # third-party
+from vcorelib.io.types import JsonObject
 from vcorelib.logging import forward_flags
 
 DEFAULT_VARIANT = "app"
+DEFAULT_COMMAND = "arbiter"
+
+# The log format that runtimepy's own entry-point uses.
+LOG_FORMAT = "%(name)-36s - %(levelname)-6s - %(message)s"
+
+
+def is_headless(args: _Namespace) -> bool:
+    """Determine if an application runs without a user interface."""
+    return getattr(args, "variant", None) == "headless"
+
+
+def is_quiet(args: _Namespace) -> bool:
+    """Determine if application logging should be reduced."""
+    return bool(args.quiet or (not args.verbose and not is_headless(args)))
+
+
+def wait_for_stop(args: _Namespace) -> bool:
+    """
+    Determine if an application should wait for a stop signal (instead of
+    stopping when its app methods return).
+    """
+
+    # Ensure that the application continues to run when running the user
+    # interface.
+    return not is_headless(args) or bool(args.wait_for_stop)
 
 
 def runtimepy_cli_args(args: _Namespace) -> List[str]:
@@ -20,9 +46,7 @@ def runtimepy_cli_args(args: _Namespace) -> List[str]:
 
     flags = set(forward_flags(args, ["curses", "verbose", "no_uvloop"]))
 
-    is_headless = getattr(args, "variant", None) == "headless"
-
-    if not args.verbose and not is_headless:
+    if is_quiet(args):
         flags.add("--quiet")
 
     cli_args.extend(flags)
@@ -31,9 +55,7 @@ def runtimepy_cli_args(args: _Namespace) -> List[str]:
 
     cli_args.extend(list(forward_flags(args, ["init_only", "no_poller"])))
 
-    # Ensure that the application continues to run when running the user
-    # interface.
-    if not is_headless or args.wait_for_stop:
+    if wait_for_stop(args):
         cli_args.append("--wait-for-stop")
 
     cli_args.extend(args.configs)
@@ -41,12 +63,77 @@ def runtimepy_cli_args(args: _Namespace) -> List[str]:
     return cli_args
 
 
+def run_app(
+    args: _Namespace, configs: List[str], data: Optional[JsonObject] = None
+) -> int:
+    """
+    Run an application (based on command-line arguments). The default
+    command runs in this process, other runtimepy commands are run via
+    runtimepy's entry-point (with configuration data written to a file).
+    """
+
+    # Only load the application framework when it's needed (not while
+    # building the argument parser).
+    # pylint: disable=import-outside-toplevel
+    from logging import getLogger
+
+    from vcorelib.logging import init_logging, log_time
+
+    from conntextual.arbiter import run
+
+    if args.cmd != DEFAULT_COMMAND:
+        return runtimepy_main(args, configs, data)
+
+    init_logging(
+        _Namespace(
+            verbose=args.verbose, quiet=is_quiet(args), curses=args.curses
+        ),
+        default_format=LOG_FORMAT,
+    )
+
+    with log_time(getLogger(__name__), "Command"):
+        result = run(
+            list(args.configs) + configs,
+            data=data,
+            init_only=args.init_only,
+            wait_for_stop=wait_for_stop(args),
+            poller=not args.no_poller,
+            uvloop=not getattr(args, "no_uvloop", False),
+            curses=args.curses,
+        )
+
+    return result
+
+
+def runtimepy_main(
+    args: _Namespace, configs: List[str], data: Optional[JsonObject] = None
+) -> int:
+    """Run a runtimepy command via its entry-point."""
+
+    # pylint: disable=import-outside-toplevel
+    from runtimepy.entry import main
+    from vcorelib.io import ARBITER
+    from vcorelib.paths.context import tempfile
+
+    cli_args = runtimepy_cli_args(args) + configs
+
+    with tempfile(suffix=".json") as path:
+        if data is not None:
+            assert ARBITER.encode(path, data)[0]
+            cli_args.append(str(path))
+
+        print(f"runtimepy_main({cli_args})")
+        result = main(cli_args)
+
+    return result
+
+
 def common_cli_args(parser: _ArgumentParser) -> None:
     """Add common command-line options."""
 
     parser.add_argument(
         "-c",
         "--cmd",
-        default="arbiter",
+        default=DEFAULT_COMMAND,
         help="runtimepy command to run (default: %(default)s)",
     )
@@ -0,0 +1,63 @@
+"""
+A module implementing import-time measurements (e.g. for catching start-up
+regressions).
+"""
+
+# built-in
+from subprocess import run
+from sys import executable
+from typing import List, NamedTuple
+
+# Packages that are comparatively slow to import (and are only needed by some
+# application variants).
+HEAVY_MODULES = [
+    "numpy",
+    "plotext",
+    "psutil",
+    "rich",
+    "textual",
+    "textual_plotext",
+]
+
+
+class ImportTime(NamedTuple):
+    """The result of measuring a module's import time."""
+
+    module: str
+
+    # The module's cumulative import time (including its dependencies).
+    seconds: float
+
+    # Heavy modules that were loaded as a result of importing this one.
+    heavy: List[str]
+
+
+def import_time(module: str) -> ImportTime:
+    """Measure a module's import time (in a new interpreter)."""
+
+    result = run(
+        [
+            executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {module}; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines are formatted as 'import time: self [us] | cumulative | name'.
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative_us = int(fields[1])
+
+    loaded = set(result.stdout.split())
+    return ImportTime(
+        module,
+        cumulative_us / 1e6,
+        [x for x in HEAVY_MODULES if x in loaded],
+    )
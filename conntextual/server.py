@@ -8,9 +8,6 @@ from argparse import Namespace as _Namespace
 import socket
 from typing import Any
 
-# third-party
-from runtimepy.net import IPv4Host, get_free_socket_name
-
 
 def server_args(
     parser: _ArgumentParser,
@@ -73,6 +70,11 @@ def server_args(
 def server_config(args: _Namespace) -> dict[str, Any]:
     """Get a server configuration based on command-line arguments."""
 
+    # Networking interfaces are only loaded when they're needed (not while
+    # building the argument parser).
+    # pylint: disable=import-outside-toplevel
+    from runtimepy.net import IPv4Host, get_free_socket_name
+
     config: dict[str, Any] = {
         "includes": ["package://runtimepy/factories.yaml"],
         "servers": [
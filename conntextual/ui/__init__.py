@@ -5,24 +5,46 @@ A module implementing a basic user interface.
 # built-in
 from asyncio import sleep
 from dataclasses import dataclass
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 # third-party
 from runtimepy.net.arbiter import AppInfo
 
-# internal
-from conntextual.ui.base import Base
-from conntextual.ui.channel.environment import ChannelEnvironmentDisplay
-from conntextual.ui.channel.log import ChannelEnvironmentLog, InputWithHistory
-from conntextual.ui.channel.model import ChannelEnvironmentSource
-from conntextual.ui.task import TuiDispatchTask
+if TYPE_CHECKING:  # pragma: nocover
+    # internal
+    from conntextual.ui.base import Base
+    from conntextual.ui.channel.environment import ChannelEnvironmentDisplay
+    from conntextual.ui.channel.model import ChannelEnvironmentSource
+    from conntextual.ui.task import TuiDispatchTask
 
 __all__ = [
     "Base",
     "test",
     "ChannelEnvironmentDisplay",
     "ChannelEnvironmentSource",
+    "TuiDispatchTask",
 ]
 
+# Attributes that are only loaded when they're first accessed (the user
+# interface depends on packages that are comparatively slow to import, which
+# other application variants, e.g. 'curses' and 'headless', don't need).
+LAZY_ATTRIBUTES = {
+    "Base": "conntextual.ui.base",
+    "ChannelEnvironmentDisplay": "conntextual.ui.channel.environment",
+    "ChannelEnvironmentSource": "conntextual.ui.channel.model",
+    "TuiDispatchTask": "conntextual.ui.task",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load a module attribute (on first access)."""
+
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    return getattr(import_module(LAZY_ATTRIBUTES[name]), name)
+
 
 async def stop_after(app: AppInfo) -> int:
     """Run a textual application."""
@@ -58,31 +80,53 @@ class MockCellEvent:
     coordinate: MockCoordinate
 
 
-async def tui_test(tui: Base) -> None:
+async def tui_test(tui: "Base") -> None:
     """Test the UI."""
 
-    # Set this to a low value for coverage.
+    # pylint: disable=import-outside-toplevel
+    from conntextual.ui.channel.log import (
+        ChannelEnvironmentLog,
+        InputWithHistory,
+    )
+
+    # Set these to low values for coverage.
     tui.model.env.set("max_plot_samples", 1)
+    tui.model.env.set("max_log_records", 0)
+    tui.model.env.set("housekeeping_period_s", 0.0)
 
     await tui.composed.wait()
 
+    # Event-loop metrics are published in the UI's environment.
+    assert tui.model.env.exists("event_loop.pending_tasks")
+
     iterations = 2 * len(tui.model.environments)
 
-    # Cycle through tabs.
+    # Cycle through tabs (changing tabs starts timers, so it's done in the
+    # application's context).
     for direction in [True, False]:
         for _ in range(iterations):
-            tui.action_tab(direction)
+            tui.schedule(tui.action_tab, direction)
             await sleep(0.05)
 
     tui.action_toggle_pause()
     tui.action_toggle_pause()
 
+    # Only update visible table rows for a few frames.
+    tui.model.env.set("update_visible_only", True)
+    await sleep(0.2)
+    tui.model.env.set("update_visible_only", False)
+
     # Test input tab handling.
     await tui.action_focus("tui-input")
-    tui.action_tab(True)
+    tui.schedule(tui.action_tab, True)
 
     # Send some commands.
-    for env in tui.model.environments:
+    for idx, env in enumerate(tui.model.environments):
+        # Display each environment's tab (after any other tab changes).
+        tui.schedule(tui.select_tab, idx)
+        while tui.displayed is not env or not env.ready:
+            await sleep(0.01)
+
         log = env.query_one(ChannelEnvironmentLog)
         input_box = env.query_one(InputWithHistory)
 
@@ -93,6 +137,16 @@ async def tui_test(tui: Base) -> None:
         processor.get_suggestion("set m")
         processor.get_suggestion("set e")
 
+        # Complete channel names from the search index.
+        await log.suggester.get_suggestion("set m")
+        await log.suggester.get_suggestion("set")
+
+        # Search for channels (and cycle through matches). Table cursor
+        # movement starts timers, so it's done in the application's context.
+        for query in ["a 0", "a 0", "a 0", "no such channel", ""]:
+            tui.schedule(env.handle_search, MockEvent(query))
+        await sleep(0.05)
+
         env.handle_cell_selected(
             MockCellEvent(MockCoordinate(1)),  # type: ignore
         )
@@ -100,6 +154,13 @@ async def tui_test(tui: Base) -> None:
         tui.action_refresh_plot()
         tui.action_random_channel()
 
+        # Overlay channels (and remove one of them again).
+        tui.action_overlay_channel()
+        rows = list(env.channels_by_row)
+        for row in rows[:3] + rows[:1]:
+            env.overlay_channel(row)
+        await sleep(0.05)
+
         for command in [
             "test",
             "help",
@@ -127,6 +188,9 @@ async def tui_test(tui: Base) -> None:
 async def test(app: AppInfo) -> int:
     """Run a textual application."""
 
+    # pylint: disable=import-outside-toplevel
+    from conntextual.ui.task import TuiDispatchTask
+
     if not app.stop.is_set():
         periodics = list(app.search_tasks(kind=TuiDispatchTask))
         assert (
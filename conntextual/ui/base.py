@@ -4,30 +4,38 @@ A module implementing a user interface base application.
 
 # built-in
 import asyncio
-from contextlib import suppress
+from functools import partial
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, List, Optional
 
 # third-party
 from runtimepy.channel.environment import ChannelEnvironment
 from runtimepy.net.arbiter import AppInfo
+from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.css.query import NoMatches
 from textual.keys import Keys
 from textual.logging import TextualHandler
 from textual.widgets import Input, TabbedContent
 
 # internal
 from conntextual.ui.channel.environment import ChannelEnvironmentDisplay
+from conntextual.ui.channel.metrics import FrameMetrics
 from conntextual.ui.channel.model import ChannelEnvironmentSource
 from conntextual.ui.channel.pattern import PatternPair
+from conntextual.ui.channel.snapshot import (
+    FrameOptions,
+    FrameSnapshot,
+    SnapshotChannel,
+)
 from conntextual.ui.footer import CustomFooter
 from conntextual.ui.model import Model
+from conntextual.ui.overview import FleetOverview
 
 TCSS_ROOT = Path(__file__).parent.parent.joinpath("data", "tcss")
+OVERVIEW_NAME = "overview"
 
 
 class Base(App[None]):
@@ -41,6 +49,7 @@ class Base(App[None]):
         ("g", "screenshot", "take a screenshot"),
         ("r", "refresh_plot", "refresh plot"),
         ("R", "random_channel", "plot random channel"),
+        ("o", "overlay_channel", "overlay channel"),
         Binding(Keys.Tab, "tab(True)", "Next tab", priority=True),
         Binding(Keys.BackTab, "tab(False)", "Previous tab", priority=True),
     ]
@@ -50,6 +59,22 @@ class Base(App[None]):
     model: Model
     composed: asyncio.Event
 
+    # Environments with composed contents (least recently displayed first),
+    # and the one currently displayed.
+    resident: List[ChannelEnvironmentDisplay]
+    displayed: Optional[ChannelEnvironmentDisplay]
+
+    # The event loop that channel values are updated on, and this
+    # application's (these are different if this application runs in its
+    # own thread, in which case display updates are applied from snapshots).
+    arbiter_loop: asyncio.AbstractEventLoop
+    ui_loop: asyncio.AbstractEventLoop
+    threaded: bool
+
+    snapshots: SnapshotChannel[tuple[ChannelEnvironmentDisplay, FrameSnapshot]]
+    display_metrics: FrameMetrics
+    frames_applied: int
+
     tab_pattern: PatternPair
 
     def action_toggle_pause(self) -> None:
@@ -80,7 +105,12 @@ class Base(App[None]):
         if idx < 0:
             idx += num_tabs
 
-        tabs.active = f"tab-{idx + 1}"
+        self.select_tab(idx)
+
+    def select_tab(self, idx: int) -> None:
+        """Change the active tab (by index)."""
+
+        self.tabs.active = f"tab-{idx + 1}"
 
         # Update footer.
         footer = self.query_one(CustomFooter)
@@ -99,51 +129,148 @@ class Base(App[None]):
         ):
             yield from self.model.environments
 
+    def activate_tab(self, idx: int) -> None:
+        """
+        Activate the channel-environment display for a tab (and prefetch
+        adjacent ones). Displays for tabs that weren't activated recently are
+        hibernated if there are more than 'resident_tabs' (app config).
+        """
+
+        environments = self.model.environments
+        num_tabs = len(environments)
+
+        self.displayed = environments[idx]
+        to_activate = [environments[idx]]
+
+        prefetch: int = self.model.app.config.get(
+            "tab_prefetch", 0
+        )  # type: ignore
+        for offset in range(1, min(prefetch, num_tabs // 2) + 1):
+            for env in [
+                environments[(idx + offset) % num_tabs],
+                environments[(idx - offset) % num_tabs],
+            ]:
+                # Adjacent tabs that are already resident are skipped.
+                if env not in self.resident and env not in to_activate:
+                    to_activate.append(env)
+
+        for env in reversed(to_activate):
+            if env in self.resident:
+                self.resident.remove(env)
+            self.resident.append(env)
+            env.activate()
+
+        resident_tabs: int = self.model.app.config.get(
+            "resident_tabs", 0
+        )  # type: ignore
+        if resident_tabs > 0:
+            while len(self.resident) > max(resident_tabs, len(to_activate)):
+                self.resident.pop(0).hibernate()
+
+    @on(TabbedContent.TabActivated)
+    def handle_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Handle a tab being activated."""
+
+        if event.pane.id is not None:
+            self.activate_tab(int(event.pane.id.split("-")[1]) - 1)
+
+    def on_mount(self) -> None:
+        """Activate the initial tab."""
+
+        self.activate_tab(0)
+
     @property
     def tabs(self) -> TabbedContent:
         """Get the tab container."""
         return self.query_one(".tabs", expect_type=TabbedContent)
 
-    def dispatch(
-        self,
-        max_plot_samples: int,
-        update_table: bool = True,
-        update_log: bool = True,
-        update_plot: bool = True,
-    ) -> None:
+    def dispatch(self, options: FrameOptions) -> None:
         """Update channel values."""
 
+        with self.model.metrics.dispatch.measure():
+            self._poll_model()
+
+            if not self.model.paused:
+                env = self.displayed
+                if env is not None:
+                    env.update_channels(self.model.metrics, options)
+
+    def _poll_model(self) -> None:
+        """Update application-wide channels (and buffer log records)."""
+
         self.model.uptime.value = (
             asyncio.get_running_loop().time() - self.model.start
         )
 
-        if not self.model.paused:
-            env = self.current_channel_environment
-            if env is not None:
-                env.update_channels(
-                    max_plot_samples,
-                    update_table=update_table,
-                    update_log=update_log,
-                    update_plot=update_plot,
-                )
+        # Buffer log records for all environments (only the current one's
+        # are written to its log widget).
+        self.model.metrics.log_records_dropped.value += sum(
+            x.log_buffer.drain() for x in self.model.environments
+        )
+
+        if self.model.overview is not None:
+            self.model.overview.update()
+
+    def capture(self, options: FrameOptions) -> None:
+        """
+        Capture channel values and send them to this application's thread
+        (where they're applied). Only the most recent snapshot is applied if
+        this application falls behind.
+        """
+
+        self._poll_model()
+
+        env = self.displayed
+        if not self.model.paused and env is not None:
+            with self.model.metrics.capture.measure():
+                snapshot = env.capture(options)
+            if snapshot is not None:
+                self.model.metrics.plot_samples.value = snapshot.plot_samples
+                if self.snapshots.put((env, snapshot)):
+                    self.ui_loop.call_soon_threadsafe(self._apply_snapshot)
+
+        self.model.snapshots_dropped.value = self.snapshots.dropped
+
+    def _apply_snapshot(self) -> None:
+        """Apply the most recent snapshot (on this application's thread)."""
+
+        item = self.snapshots.take()
+        if item is not None:
+            env, snapshot = item
+
+            metrics = self.display_metrics
+            with metrics.dispatch.measure():
+                env.apply(snapshot, metrics)
+
+            self.arbiter_loop.call_soon_threadsafe(
+                self._record_display_metrics
+            )
+
+    def _record_display_metrics(self) -> None:
+        """
+        Update display-update channels (on the loop that channel values are
+        updated on).
+        """
+
+        self.model.metrics.assign_display(self.display_metrics)
+        self.frames_applied += 1
+
+    def schedule(self, callback: Callable[..., Any], *args: Any) -> None:
+        """
+        Schedule a callback to run (in this application's context) from
+        any thread.
+        """
+
+        self.ui_loop.call_soon_threadsafe(
+            partial(self.call_later, callback, *args)
+        )
 
     @property
     def current_channel_environment(
         self,
     ) -> Optional[ChannelEnvironmentDisplay]:
         """Get the current channel-environment display."""
-
-        env = None
-
-        with suppress(NoMatches):
-            curr = self.tabs.active
-            if curr:
-                env = self.query_one(
-                    f"#{self.model.tab_to_id[curr]}",
-                    expect_type=ChannelEnvironmentDisplay,
-                )
-
-        return env
+        return self.displayed
 
     def action_random_channel(self) -> None:
         """Randomize the channel on the current tab."""
@@ -152,6 +279,13 @@ class Base(App[None]):
         if env is not None:
             env.random_channel()
 
+    def action_overlay_channel(self) -> None:
+        """Overlay the highlighted channel on the current tab's plot."""
+
+        env = self.current_channel_environment
+        if env is not None:
+            env.overlay_channel()
+
     def action_refresh_plot(self) -> None:
         """Refresh the current plot."""
 
@@ -175,6 +309,16 @@ class Base(App[None]):
     def _init_environments(self) -> None:
         """Initialize channel-environment display instances."""
 
+        # State shared with channel updates is only changed on the arbiter's
+        # loop if this application runs in its own thread.
+        loop = self.arbiter_loop if self.threaded else None
+
+        # Connections to remote sessions (e.g. opened by the 'client'
+        # command).
+        remote = set(
+            self.model.app.config.get("remote_connections", [])  # type: ignore
+        )
+
         # Channels for tasks and connections.
         self.model.environments += [
             ChannelEnvironmentDisplay.create(
@@ -184,6 +328,7 @@ class Base(App[None]):
                 task.logger,
                 self.model.app,
                 channel_pattern=self._get_env_channel_pattern(name),
+                loop=loop,
             )
             for name, task in self.model.app.tasks.items()
             if self.ui_enabled(name)
@@ -191,10 +336,15 @@ class Base(App[None]):
             ChannelEnvironmentDisplay.create(
                 name,
                 conn.command,
-                ChannelEnvironmentSource.CONNECTION_LOCAL,
+                (
+                    ChannelEnvironmentSource.CONNECTION_REMOTE
+                    if name in remote
+                    else ChannelEnvironmentSource.CONNECTION_LOCAL
+                ),
                 conn.logger,
                 self.model.app,
                 channel_pattern=self._get_env_channel_pattern(name),
+                loop=loop,
             )
             for name, conn in self.model.app.connections.items()
             if self.ui_enabled(name)
@@ -208,24 +358,69 @@ class Base(App[None]):
                     self.model.environments[0],
                 )
 
+        self._init_overview(loop)
+
         # One indexed tabs automatically enumerate for the tabbed environment,
         # keep a mapping of tabs index to element identifier.
         for idx, env in enumerate(self.model.environments):
             assert env.id is not None
             self.model.tab_to_id[f"tab-{1 + idx}"] = env.id
 
+    def _init_overview(
+        self, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """
+        Add an overview tab (last) if channels are compared across
+        environments (the 'overview_pattern' app config).
+        """
+
+        pattern: dict[str, Any] = self.model.app.config.get(
+            "overview_pattern", {}
+        )  # type: ignore
+        if not pattern:
+            return
+
+        overview = FleetOverview(
+            [
+                (idx + 1, env.model.env)
+                for idx, env in enumerate(self.model.environments)
+            ],
+            PatternPair.from_dict(pattern),
+            logging.getLogger(OVERVIEW_NAME),
+        )
+        self.model.environments.append(
+            ChannelEnvironmentDisplay.create(
+                OVERVIEW_NAME,
+                overview.command,
+                ChannelEnvironmentSource.OVERVIEW,
+                overview.command.logger,
+                self.model.app,
+                channel_pattern=self._get_env_channel_pattern(OVERVIEW_NAME),
+                loop=loop,
+            )
+        )
+        self.model.overview = overview
+
     def compose(self) -> ComposeResult:
         """Create child nodes."""
 
+        self.ui_loop = asyncio.get_running_loop()
+
         self._init_environments()
         yield from self.compose_app()
-        self.composed.set()
+        self.arbiter_loop.call_soon_threadsafe(self.composed.set)
 
     @staticmethod
     def create(
-        app: AppInfo, env: ChannelEnvironment, handle_debug: bool = True
+        app: AppInfo,
+        env: ChannelEnvironment,
+        handle_debug: bool = True,
+        threaded: bool = False,
     ) -> "Base":
-        """Create an application instance."""
+        """
+        Create an application instance (that runs in its own thread, if
+        'threaded' is set).
+        """
 
         if handle_debug and app.config.get("debug"):
             logging.basicConfig(level="NOTSET", handlers=[TextualHandler()])
@@ -234,6 +429,15 @@ class Base(App[None]):
         result = Base()
         result.model = Model.create(app, env)
         result.composed = asyncio.Event()
+        result.resident = []
+        result.displayed = None
+
+        result.arbiter_loop = asyncio.get_running_loop()
+        result.ui_loop = result.arbiter_loop
+        result.threaded = threaded
+        result.snapshots = SnapshotChannel()
+        result.display_metrics = FrameMetrics.create()
+        result.frames_applied = 0
         result.tab_pattern = PatternPair.from_dict(
             app.config.get("tab_pattern", {}),  # type: ignore
         )
@@ -243,4 +447,4 @@ class Base(App[None]):
     async def action_quit(self) -> None:
         """Stop the rest of the application when quitting."""
         await super().action_quit()
-        self.model.app.stop.set()
+        self.arbiter_loop.call_soon_threadsafe(self.model.app.stop.set)
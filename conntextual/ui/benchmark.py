@@ -0,0 +1,235 @@
+"""
+A module implementing a benchmark for user-interface updates.
+"""
+
+# built-in
+import asyncio
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+from timeit import timeit
+from typing import Any, Callable, Dict, List
+
+# third-party
+import numpy as np
+import psutil
+from runtimepy.net.arbiter import AppInfo
+from vcorelib.io import ARBITER
+
+# internal
+from conntextual.ui.base import Base
+from conntextual.ui.channel.pattern import PatternPair
+from conntextual.ui.synthetic import DEFAULT_UPDATE_FRACTION, SyntheticTask
+from conntextual.ui.task import TuiDispatchTask
+
+DEFAULT_FRAMES = 100
+
+# The number of channels plotted during a benchmark.
+PLOTTED_CHANNELS = 4
+
+PERCENTILES = [50, 90, 99]
+STAGES = ["capture", "table", "log", "plot", "dispatch"]
+MIB = 1024**2
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize per-frame samples with percentiles."""
+
+    result = {
+        f"p{pct}": float(value)
+        for pct, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES))
+    }
+    result["max"] = float(max(samples))
+    return result
+
+
+def rss_mib() -> float:
+    """Get this process's resident-set size (in mebibytes)."""
+    return float(psutil.Process().memory_info().rss) / MIB
+
+
+def match_all(method: Callable[[str], bool], names: List[str]) -> None:
+    """Match every name with a pattern-matching method."""
+
+    for name in names:
+        method(name)
+
+
+def benchmark_patterns(
+    pair: PatternPair, names: List[str], number: int = 3
+) -> Dict[str, float]:
+    """
+    Time matching names with individual patterns, combined patterns and
+    memoized results (in milliseconds, per pass over the names).
+    """
+
+    # Without combined patterns, each pattern is searched individually.
+    individual = pair._replace(include=None, exclude=None)
+
+    return {
+        strategy: timeit(partial(match_all, method, names), number=number)
+        * 1e3
+        / number
+        for strategy, method in [
+            ("individual", individual.matches_uncached),
+            ("combined", pair.matches_uncached),
+            ("cached", pair.matches),
+        ]
+    }
+
+
+async def activate(tui: Base, idx: int) -> Dict[str, float]:
+    """
+    Display an environment's tab (and wait for its contents). Returns the
+    time taken and the resulting change in memory use.
+    """
+
+    env = tui.model.environments[idx]
+
+    initial_rss = rss_mib()
+    start = perf_counter()
+
+    tui.schedule(tui.select_tab, idx)
+    while not env.ready:
+        await asyncio.sleep(0.01)
+
+    return {
+        "activate_ms": (perf_counter() - start) * 1e3,
+        "composed_mib": rss_mib() - initial_rss,
+    }
+
+
+async def dispatch(task: TuiDispatchTask) -> None:
+    """
+    Dispatch a frame (and wait for it to be applied, if the application runs
+    in its own thread).
+    """
+
+    tui = task.tui
+    applied = tui.frames_applied
+
+    await task.dispatch()
+
+    while tui.threaded and tui.frames_applied == applied:
+        await asyncio.sleep(0.001)
+
+
+async def benchmark_environment(
+    task: TuiDispatchTask,
+    idx: int,
+    synthetic: List[SyntheticTask],
+    frames: int,
+    update_fraction: float,
+) -> Dict[str, Any]:
+    """Benchmark display updates for a single environment."""
+
+    tui = task.tui
+    env = tui.model.environments[idx]
+    metrics = tui.model.metrics
+
+    activation = await activate(tui, idx)
+    composed_rss = rss_mib()
+
+    for row in list(env.channels_by_row)[:PLOTTED_CHANNELS]:
+        tui.schedule(env.overlay_channel, row)
+
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+
+    for frame in range(frames):
+        for source in synthetic:
+            source.update(update_fraction)
+        env.model.logger.info("Frame %d.", frame)
+
+        await dispatch(task)
+
+        for stage in STAGES:
+            samples[stage].append(getattr(metrics, stage).last.value)
+
+        # Allow the application to render.
+        await asyncio.sleep(0)
+
+    return {
+        "name": env.model.name,
+        "rows": len(env.by_index),
+        "frames": frames,
+        **activation,
+        "frames_mib": rss_mib() - composed_rss,
+        "stages_ms": {
+            stage: summarize(values) for stage, values in samples.items()
+        },
+    }
+
+
+async def run(app: AppInfo) -> int:
+    """
+    Benchmark display updates for synthetic-environment tasks (configured by
+    the 'benchmark' app config).
+    """
+
+    config: Dict[str, Any] = app.config.get("benchmark", {})  # type: ignore
+
+    tasks = list(app.search_tasks(kind=TuiDispatchTask))
+    assert len(tasks) == 1, f"{len(tasks)} application tasks found!"
+    task = tasks[0]
+    await task.tui.composed.wait()
+
+    # Frames are dispatched by the benchmark instead.
+    task.paused.value = True
+
+    synthetic = list(app.search_tasks(kind=SyntheticTask))
+    names = {x.name for x in synthetic}
+
+    results: Dict[str, Any] = {"environments": []}
+    for idx, env in enumerate(task.tui.model.environments):
+        if env.model.name in names:
+            result = await benchmark_environment(
+                task,
+                idx,
+                synthetic,
+                config.get("frames", DEFAULT_FRAMES),
+                config.get("update_fraction", DEFAULT_UPDATE_FRACTION),
+            )
+            results["environments"].append(result)
+
+            app.logger.info(
+                "%s: %d rows, activated in %.1f ms "
+                "(+%.1f MiB, +%.1f MiB over %d frames).",
+                result["name"],
+                result["rows"],
+                result["activate_ms"],
+                result["composed_mib"],
+                result["frames_mib"],
+                result["frames"],
+            )
+            for stage, summary in result["stages_ms"].items():
+                app.logger.info(
+                    "  %-12s %s",
+                    stage,
+                    " ".join(f"{k}={v:.3f}ms" for k, v in summary.items()),
+                )
+
+    # Match the benchmarked environments' channel names with a pattern pair.
+    patterns = config.get("patterns")
+    if patterns:
+        timings = benchmark_patterns(
+            PatternPair.from_dict(patterns),
+            [
+                name
+                for env in task.tui.model.environments
+                if env.model.name in names
+                for name in env.model.env.names
+            ],
+        )
+        results["patterns_ms"] = timings
+
+        app.logger.info(
+            "Pattern matching: %s.",
+            " ".join(f"{k}={v:.3f}ms" for k, v in timings.items()),
+        )
+
+    output = config.get("output")
+    if output:
+        ARBITER.encode(Path(output), results)
+
+    app.stop.set()
+    return 0
@@ -0,0 +1,135 @@
+"""
+A module implementing a ring buffer for plotted channel samples.
+"""
+
+# third-party
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+from runtimepy.primitives import AnyPrimitive
+
+DEFAULT_CAPACITY = 64
+
+
+def sample_dtype(primitive: AnyPrimitive) -> np.dtype[np.generic]:
+    """Get a sample data type for a given primitive."""
+
+    kind = primitive.kind
+
+    # Plotting performs arithmetic on individual samples (which isn't
+    # numerically robust for narrow or unsigned types), so samples are
+    # always widened. Scaled values are always floating-point.
+    result: np.dtype[np.generic] = np.dtype(np.float64)
+
+    if not (kind.is_float or primitive.scaling or kind.name == "uint64"):
+        result = np.dtype(np.int64)
+
+    return result
+
+
+class SampleBuffer:
+    """
+    A ring buffer of timestamped samples. Every sample is written twice
+    (the underlying arrays are twice the buffer's capacity) so that the most
+    recent samples are always available as a contiguous view.
+    """
+
+    def __init__(
+        self, dtype: DTypeLike, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """Initialize this instance."""
+
+        self.dtype = np.dtype(dtype)
+        self.limit = capacity
+
+        # Incremented whenever this buffer's samples change.
+        self.generation = 0
+
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate new (empty) underlying storage."""
+
+        self.capacity = max(capacity, 1)
+        self._timestamps = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._values: NDArray[np.generic] = np.zeros(
+            2 * self.capacity, dtype=self.dtype
+        )
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Get the number of samples in this buffer."""
+        return self._count
+
+    def clear(self) -> None:
+        """Remove all samples from this buffer."""
+
+        self._head = 0
+        self._count = 0
+        self.generation += 1
+
+    def resize(self, limit: int) -> None:
+        """
+        Set the maximum number of samples to retain. Shrinking the buffer only
+        changes the retained-sample limit, storage is only re-allocated if the
+        limit grows past the current capacity.
+        """
+
+        limit = max(limit, 0)
+
+        if limit > self.capacity:
+            timestamps = self.timestamps.copy()
+            values = self.values.copy()
+
+            self._allocate(limit)
+
+            count = len(timestamps)
+            self._timestamps[:count] = timestamps
+            self._timestamps[self.capacity : self.capacity + count] = (
+                timestamps
+            )
+            self._values[:count] = values
+            self._values[self.capacity : self.capacity + count] = values
+            self._head = count
+            self._count = count
+
+        # Discard samples past the new limit (so that they don't re-appear if
+        # the limit is raised again).
+        if limit < self._count:
+            self._count = limit
+            self.generation += 1
+
+        self.limit = limit
+
+    def append(self, timestamp: float, value: float | int | bool) -> None:
+        """Add a sample to this buffer."""
+
+        head = self._head
+        mirror = head + self.capacity
+
+        self._timestamps[head] = timestamp
+        self._timestamps[mirror] = timestamp
+        self._values[head] = value
+        self._values[mirror] = value
+
+        head += 1
+        self._head = head if head < self.capacity else 0
+
+        if self._count < self.limit:
+            self._count += 1
+
+        self.generation += 1
+
+    @property
+    def timestamps(self) -> NDArray[np.float64]:
+        """Get a view of this buffer's sample timestamps."""
+
+        end = self._head + self.capacity
+        return self._timestamps[end - len(self) : end]
+
+    @property
+    def values(self) -> NDArray[np.generic]:
+        """Get a view of this buffer's sample values."""
+
+        end = self._head + self.capacity
+        return self._values[end - len(self) : end]
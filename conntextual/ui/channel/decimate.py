@@ -0,0 +1,53 @@
+"""
+A module implementing plot-data decimation.
+"""
+
+# third-party
+import numpy as np
+from numpy.typing import NDArray
+
+# The number of horizontal 'pixels' per character cell for plot markers.
+MARKER_RESOLUTION = {"braille": 2, "hd": 2, "fhd": 2}
+
+
+def plot_columns(width: int, marker: str) -> int:
+    """Get the horizontal plot resolution for a widget width and marker."""
+    return width * MARKER_RESOLUTION.get(marker, 1)
+
+
+def decimate(
+    x: NDArray[np.generic], y: NDArray[np.generic], columns: int
+) -> tuple[NDArray[np.generic], NDArray[np.generic]]:
+    """
+    Reduce series data to (at most) a minimum and maximum sample per display
+    column, so that spikes are preserved.
+    """
+
+    count = len(y)
+
+    # Nothing to reduce.
+    if columns <= 0 or count <= 2 * columns:
+        return x, y
+
+    # Bucket samples by index (every bucket is the same size, except the
+    # last one).
+    size = -(-count // columns)
+    full = (count // size) * size
+
+    buckets = y[:full].reshape(-1, size)
+    offsets = np.arange(0, full, size)
+
+    indices = [
+        offsets + buckets.argmin(axis=1),
+        offsets + buckets.argmax(axis=1),
+    ]
+
+    if full < count:
+        tail = y[full:]
+        indices.append(np.array([full + tail.argmin(), full + tail.argmax()]))
+
+    # Keep samples in order (and don't emit a sample twice if it's both the
+    # minimum and maximum of a bucket).
+    result = np.unique(np.concatenate(indices))
+
+    return x[result], y[result]
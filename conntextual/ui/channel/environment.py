@@ -3,8 +3,9 @@ A module implementing user interface elements for channel environments.
 """
 
 # built-in
+import asyncio
 import random
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Union
 
 # third-party
 from rich.text import Text
@@ -14,29 +15,56 @@ from runtimepy.channel.environment.command.processor import (
 )
 from runtimepy.enum import RuntimeEnum
 from runtimepy.net.arbiter import AppInfo
+from runtimepy.primitives import AnyPrimitive
 from runtimepy.registry.name import RegistryKey
 from textual import on
-from textual.app import ComposeResult
-from textual.containers import HorizontalScroll, ScrollableContainer
+from textual.containers import (
+    HorizontalScroll,
+    ScrollableContainer,
+    Vertical,
+)
 from textual.coordinate import Coordinate
-from textual.widgets import Collapsible, DataTable, Pretty, Static
+from textual.widget import Widget
+from textual.widgets import (
+    Collapsible,
+    DataTable,
+    Input,
+    Log,
+    Pretty,
+    Static,
+)
 from vcorelib.logging import LoggerType
-from vcorelib.math import to_nanos
+from vcorelib.math import default_time_ns
 
 # internal
 from conntextual.ui.channel.color import bit_field_style, type_str_style
-from conntextual.ui.channel.log import ChannelEnvironmentLog
+from conntextual.ui.channel.format import channel_formatter, field_formatter
+from conntextual.ui.channel.log import (
+    MAX_LINES,
+    ChannelEnvironmentLog,
+    LogBuffer,
+)
+from conntextual.ui.channel.metrics import FrameMetrics
 from conntextual.ui.channel.model import ChannelEnvironmentSource, Model
 from conntextual.ui.channel.pattern import PatternPair
 from conntextual.ui.channel.plot import Plot
-from conntextual.ui.channel.selected import SelectedChannel
+from conntextual.ui.channel.row import ChannelRow
+from conntextual.ui.channel.search import ChannelSearch
+from conntextual.ui.channel.selected import SelectedChannel, SelectedChannels
+from conntextual.ui.channel.snapshot import (
+    CaptureState,
+    FrameOptions,
+    FrameSnapshot,
+)
 from conntextual.ui.channel.suggester import CommandSuggester
 from conntextual.util import css_name
 
 __all__ = ["ChannelEnvironmentDisplay"]
 COLUMNS = ["type", "name", "value"]
 DEFAULT_VALUE_COL_WIDTH = 22
-STALE_THRESHOLD_NS = to_nanos(0.5)
+
+# Rows just outside of the visible region that are also kept up to date.
+VIEWPORT_MARGIN_ROWS = 4
 
 
 class ChannelEnvironmentDisplay(Static):
@@ -44,25 +72,38 @@ class ChannelEnvironmentDisplay(Static):
 
     model: Model
 
-    by_index: List[Tuple[Coordinate, RegistryKey]]
-    channels_by_row: Dict[int, SelectedChannel]
+    by_index: List[ChannelRow]
+
+    # Names of the channels in each (channel) row. Selected-channel instances
+    # are only created when a channel is plotted.
+    channels_by_row: Dict[int, str]
 
-    selected: SelectedChannel
+    selected: SelectedChannels
     row_idx: int
 
     channel_pattern: PatternPair
+    log_buffer: LogBuffer
+
+    # Created once the table is populated.
+    capture_state: CaptureState
+
+    # Created when contents are composed (and freed when they're removed).
+    search: Optional[ChannelSearch]
+
+    # Contents are only composed once this environment is activated (e.g.
+    # its tab is displayed), and are ready once the table is populated.
+    activated: bool
+    ready: bool
 
     def add_channel(
         self, name: str, chan: AnyChannel, enum: Optional[RuntimeEnum]
-    ) -> int:
+    ) -> None:
         """Add a channel to the table."""
 
         table = self.query_one(DataTable)
         env = self.model.env
 
-        self.channels_by_row[self.row_idx] = SelectedChannel.create(
-            name, (chan, enum)
-        )
+        self.channels_by_row[self.row_idx] = name
 
         kind_str = str(chan.type)
 
@@ -77,7 +118,6 @@ class ChannelEnvironmentDisplay(Static):
             name if not chan.commandable else Text(name, style="bold green"),
             " " * max(len(str(env.value(name))), DEFAULT_VALUE_COL_WIDTH),
         )
-        return chan.id
 
     def add_field(self, name: str) -> None:
         """Add a bit-field row entry."""
@@ -96,53 +136,191 @@ class ChannelEnvironmentDisplay(Static):
             " " * max(len(str(env.value(name))), DEFAULT_VALUE_COL_WIDTH),
         )
 
-    def on_mount(self) -> None:
+    def activate(self) -> None:
+        """Compose this instance's contents (if they haven't been already)."""
+
+        if not self.activated:
+            self.activated = True
+            self.call_later(self._compose_contents)
+
+    async def _compose_contents(self) -> None:
+        """Compose and populate this instance's contents."""
+
+        # This instance may have been hibernated (and activated again) since
+        # this was scheduled (contents that weren't removed have an index).
+        if not self.activated:
+            return
+        if self.search is not None:
+            self.ready = True
+            return
+
+        # The name index is also used for command completion (its lookup
+        # structures are only built once they're used).
+        self.search = ChannelSearch.create(self.model.env.names)
+
+        await self.mount_all(self.contents())
+
+        # The application may have exited while contents were being mounted.
+        if self.is_attached:
+            self.populate()
+
+    def hibernate(self) -> None:
+        """
+        Remove this instance's contents (they're composed again when this
+        instance is next activated).
+        """
+
+        if self.activated:
+            self.activated = False
+            self.ready = False
+            self.call_later(self._remove_contents)
+
+    async def _remove_contents(self) -> None:
+        """Remove this instance's contents (keeping lightweight state)."""
+
+        # This instance may have been activated again since this was
+        # scheduled.
+        if self.activated or self.search is None:
+            return
+
+        self.search = None
+        self.ready = False
+
+        # Log lines are written to the next log widget.
+        self.log_buffer.restore(self.query_one(Log).lines)
+
+        await self.remove_children()
+
+        self.by_index = []
+        self.row_idx = 0
+        self.channels_by_row = {}
+
+    def populate(self) -> None:
         """Populate channel table."""
 
         table = self.query_one(DataTable)
         env = self.model.env
         assert env.finalized
-        names = list(env.names)
+        assert self.search is not None
+
+        # Names are in the same order as the search index's.
+        names = self.search.index.names
+        self.search.rows = {}
 
         # Set up columns.
         table.add_columns(*COLUMNS)
         val_col = COLUMNS.index("value")
 
         ident: RegistryKey
-        for name in names:
+        primitive: AnyPrimitive
+        for name_idx, name in enumerate(names):
             if not self.channel_pattern.matches(name):
                 continue
 
+            self.search.rows[name_idx] = self.row_idx
+
             # Add channel rows.
             chan_result = env.get(name)
             if chan_result is not None:
                 chan, enum = chan_result
-                ident = self.add_channel(name, chan, enum)
+                self.add_channel(name, chan, enum)
+                ident = chan.id
+                primitive = chan.raw
+                value, formatter = channel_formatter(chan, enum)
 
             # Add field and flag rows.
             else:
                 self.add_field(name)
+                field = env.fields[name]
                 ident = name
-
-            self.by_index.append((Coordinate(self.row_idx, val_col), ident))
+                primitive = field.raw
+                value, formatter = field_formatter(
+                    field,
+                    (
+                        env.fields.enum_lookup.get(name)
+                        if field.is_enum
+                        else None
+                    ),
+                )
+
+            self.by_index.append(
+                ChannelRow.create(
+                    Coordinate(self.row_idx, val_col),
+                    ident,
+                    primitive,
+                    value,
+                    formatter,
+                )
+            )
             self.row_idx += 1
 
+        self.capture_state = CaptureState.create(self.by_index)
+        self.ready = True
+
     def switch_to_channel(self, row: int) -> None:
         """Switch the plot to a channel at the specified row."""
 
+        if self.ready and row in self.channels_by_row:
+            self.model.call_soon(
+                self._select_channel, self.channels_by_row[row]
+            )
+
+    def _selected_channel(self, name: str) -> SelectedChannel:
+        """
+        Get a channel's selected-channel instance (the plotted one, if the
+        channel is already plotted).
+        """
+
+        result = self.selected.find(name)
+        if result is None:
+            chan = self.model.env.get(name)
+            assert chan is not None
+            result = SelectedChannel.create(name, chan)
+
+        return result
+
+    def _select_channel(self, name: str) -> None:
+        """Switch the plot to a channel."""
+
+        selected = self._selected_channel(name)
+        self.selected.select(selected)
+        self.model.logger.info("Switched plot to channel '%s'.", selected.name)
+        self._reset_plot()
+
+    def overlay_channel(self, row: int = None) -> None:
+        """
+        Add the channel at the specified row (or the table cursor's row) to
+        the plot, or remove it if it's already plotted.
+        """
+
+        if not self.ready:
+            return
+
+        if row is None:
+            row = self.query_one(DataTable).cursor_coordinate.row
+
         if row in self.channels_by_row:
-            # Select channel.
-            self.selected = self.channels_by_row[row]
+            self.model.call_soon(
+                self._toggle_channel, self.channels_by_row[row]
+            )
+
+    def _toggle_channel(self, name: str) -> None:
+        """Add a channel to (or remove it from) the plot."""
 
-            # Update plot parameters.
-            name = self.selected.name
-            self.query_one(Plot).update_title(name=name)
-            self.model.logger.info("Switched plot to channel '%s'.", name)
-            self.reset_plot()
+        selected = self._selected_channel(name)
+        if self.selected.toggle(selected):
+            self.model.logger.info(
+                "Toggled plot overlay for channel '%s'.", selected.name
+            )
+            self._reset_plot()
 
     def random_channel(self) -> None:
         """Switch to a random channel."""
 
+        # Tables may not have any channel rows.
+        if not self.ready or not self.channels_by_row:
+            return
+
         row = -1
         while row not in self.channels_by_row:
             row = random.randint(0, self.row_idx - 1)
@@ -151,88 +329,229 @@ class ChannelEnvironmentDisplay(Static):
 
     def reset_plot(self) -> None:
         """Reset the selected plot."""
+        self.model.call_soon(self._reset_plot)
+
+    def _reset_plot(self) -> None:
+        """Reset the selected plot (and redraw it)."""
 
         self.selected.reset()
-        self.query_one(Plot).set_data(
-            self.selected.timestamps, self.selected.values
-        )
+
+        # Otherwise, the plot is redrawn by the next display update.
+        if self.ready and self.model.loop is None:
+            plot = self.query_one(Plot)
+            plot.update_title(name=self.selected.title)
+            plot.set_data(self.selected.series)
+
         self.model.logger.info("Plot reset.")
 
+    def visible_rows(self, table: DataTable[Union[str, int, float]]) -> slice:
+        """
+        Get the slice of rows currently scrolled into view (plus a margin).
+        """
+
+        start = table.scroll_offset.y
+        end = start + table.size.height
+
+        return slice(
+            max(start - VIEWPORT_MARGIN_ROWS, 0), end + VIEWPORT_MARGIN_ROWS
+        )
+
+    @on(Input.Changed, ".channel_search")
+    @on(Input.Submitted, ".channel_search")
+    def handle_search(
+        self, event: Union[Input.Changed, Input.Submitted]
+    ) -> None:
+        """
+        Jump to the best match for a search query as it's typed (or to the
+        next match when it's submitted again).
+        """
+
+        if self.ready and self.search is not None:
+            row = self.search.find(event.value)
+            if row is not None:
+                self.query_one(DataTable).move_cursor(row=row, animate=False)
+
     @on(DataTable.CellSelected)
     def handle_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Handle input submission."""
 
         self.switch_to_channel(event.coordinate.row)
 
+    def update_table(
+        self, table: DataTable[Union[str, int, float]], snapshot: FrameSnapshot
+    ) -> int:
+        """
+        Update channel-table values from a snapshot. Returns the number of
+        cells updated.
+        """
+
+        assert snapshot.timestamps is not None
+
+        # Only re-render cells whose value or staleness changed. Rows that
+        # aren't captured while out of view are caught up when they scroll
+        # back into view.
+        changed, stale = self.capture_state.states.poll(
+            snapshot.window, snapshot.timestamps, snapshot.now_ns
+        )
+
+        cells_updated = 0
+
+        rows = snapshot.rows[snapshot.window]
+        values = snapshot.values
+        for idx in changed.tolist():
+            row = rows[idx]
+            cell = row.render(values[idx], bool(stale[idx]))
+            if cell is not None:
+                table.update_cell_at(row.coordinate, cell)
+                cells_updated += 1
+
+        return cells_updated
+
+    def update_log(self, metrics: FrameMetrics, max_log_records: int) -> None:
+        """Write buffered log lines to the log widget."""
+
+        with metrics.log.measure():
+            self.query_one(ChannelEnvironmentLog).dispatch(
+                metrics, max_log_records
+            )
+
     def update_channels(
-        self,
-        max_plot_samples: int,
-        update_table: bool = True,
-        update_log: bool = True,
-        update_plot: bool = True,
+        self, metrics: FrameMetrics, options: FrameOptions
     ) -> None:
         """Update all channel values."""
 
-        env = self.model.env
+        if not self.ready:
+            return
+
+        if options.visible_only:
+            self.capture_state.in_view = self.visible_rows(
+                self.query_one(DataTable)
+            )
+
+        with metrics.capture.measure():
+            snapshot = self.capture(options, copy_series=False)
+
+        if snapshot is not None:
+            metrics.plot_samples.value = snapshot.plot_samples
+            self.apply(snapshot, metrics)
+
+    def capture(
+        self, options: FrameOptions, copy_series: bool = True
+    ) -> Optional[FrameSnapshot]:
+        """
+        Capture channel values (and poll the plot) for a display update
+        (that may be applied on another thread, in which case plot data is
+        copied). Visible rows are the ones that were last in view.
+        """
+
+        if not self.ready:
+            return None
+
+        state = self.capture_state
+        window = state.in_view if options.visible_only else slice(None)
+
+        timestamps = None
+        values: List[Any] = []
+        if options.update_table:
+            timestamps, values = state.values.capture(window)
+
+        series = None
+        plot_samples = 0
+        if options.update_plot:
+            plot_samples = self.selected.poll(options.max_plot_samples)
+            if copy_series:
+                series = self.selected.copy_series(state.plotted)
+                state.plotted = series
+            else:
+                series = self.selected.series
+
+        return FrameSnapshot(
+            self.by_index,
+            window,
+            default_time_ns(),
+            timestamps,
+            values,
+            self.selected.title,
+            series,
+            plot_samples,
+            options.max_log_records if options.update_log else None,
+        )
 
-        if update_table:
-            table = self.query_one(DataTable)
+    def apply(self, snapshot: FrameSnapshot, metrics: FrameMetrics) -> None:
+        """Update this display from a snapshot."""
 
-            for coord, chan in self.by_index:
-                val = env.value(chan)
-                if isinstance(val, float):
-                    val = f"{val: 15.6f}"
-                elif isinstance(val, bool):
-                    val = "true" if val else "false"
-                elif isinstance(val, int):
-                    val = f"{val: 8d}       "
+        # Discard snapshots of rows that were since removed.
+        if not self.ready or snapshot.rows is not self.by_index:
+            return
 
-                # Get the age of the primitive.
-                age = env.age_ns(chan)
-                if age > STALE_THRESHOLD_NS:
-                    val = Text(val, style="yellow")  # type: ignore
+        table = self.query_one(DataTable)
+
+        metrics.cells_updated.value = 0
+        if snapshot.timestamps is not None:
+            with metrics.table.measure():
+                metrics.cells_updated.value = self.update_table(
+                    table, snapshot
+                )
 
-                table.update_cell_at(coord, val)
+        if snapshot.max_log_records is not None:
+            self.update_log(metrics, snapshot.max_log_records)
 
-        # Update logs.
-        if update_log:
-            self.query_one(ChannelEnvironmentLog).dispatch()
+        if snapshot.series is not None:
+            with metrics.plot.measure():
+                plot = self.query_one(Plot)
+                if plot.title != snapshot.title:
+                    plot.update_title(name=snapshot.title)
+                plot.set_data(snapshot.series)
 
-        # Update plot.
-        if update_plot:
-            self.selected.poll(max_plot_samples)
-            self.query_one(Plot).dispatch()
+        self.capture_state.in_view = self.visible_rows(table)
 
     @property
     def label(self) -> str:
         """Obtain a label string for this instance."""
         return f"({self.model.source}) {self.model.name}"
 
-    def compose(self) -> ComposeResult:
+    def contents(self) -> List[Widget]:
         """Create child nodes."""
 
-        with HorizontalScroll(classes="channels"):
-            yield DataTable[Union[str, int, float]]()
-
-            yield Plot(
-                self.selected.timestamps,
-                self.selected.values,
-                str(self.model.app.config.get("plot_theme", "pro")),
-                str(self.model.app.config.get("plot_marker", "braille")),
-                title=self.selected.name,
-                id="plot",
-            )
-
         # Create log and command widget.
         log = ChannelEnvironmentLog()
         log.parent_name = self.model.name
         log.logger = self.model.logger
-        log.suggester = CommandSuggester.create(self.model.command)
-        yield log
-
-        with ScrollableContainer():
-            with Collapsible(title="configuration"):
-                yield Pretty(self.model.app.config.get("root", {}))
+        log.buffer = self.log_buffer
+        log.suggester = CommandSuggester.create(
+            self.model.command,
+            index=self.search.index if self.search is not None else None,
+        )
+        log.loop = self.model.loop
+
+        return [
+            HorizontalScroll(
+                Vertical(
+                    Input(
+                        placeholder="search channels",
+                        classes="channel_search",
+                        id=f"{css_name(self.model.name)}-search",
+                    ),
+                    DataTable[Union[str, int, float]](),
+                    classes="channel_table",
+                ),
+                Plot(
+                    self.selected.series,
+                    str(self.model.app.config.get("plot_theme", "pro")),
+                    str(self.model.app.config.get("plot_marker", "braille")),
+                    title=self.selected.title,
+                    id="plot",
+                ),
+                classes="channels",
+            ),
+            log,
+            ScrollableContainer(
+                Collapsible(
+                    Pretty(self.model.app.config.get("root", {})),
+                    title="configuration",
+                )
+            ),
+        ]
 
     @staticmethod
     def create(
@@ -242,15 +561,26 @@ class ChannelEnvironmentDisplay(Static):
         logger: LoggerType,
         app: AppInfo,
         channel_pattern: PatternPair,
+        loop: asyncio.AbstractEventLoop = None,
     ) -> "ChannelEnvironmentDisplay":
         """Create a channel-environment display."""
 
         result = ChannelEnvironmentDisplay(id=css_name(name))
-        result.model = Model(name, command, source, logger, app)
+        result.model = Model(name, command, source, logger, app, loop=loop)
         result.by_index = []
         result.channels_by_row = {}
         result.row_idx = 0
         result.channel_pattern = channel_pattern
+        result.activated = False
+        result.ready = False
+        result.search = None
+
+        # Log lines are buffered (up to a limit) while this environment isn't
+        # being displayed.
+        max_log_lines: int = app.config.get(
+            "max_log_lines", MAX_LINES
+        )  # type: ignore
+        result.log_buffer = LogBuffer.create(logger, max_log_lines)
 
         names = list(result.model.env.names)
         assert names
@@ -260,6 +590,10 @@ class ChannelEnvironmentDisplay(Static):
             name = random.choice(names)
             chan = result.model.env.get(name)
 
-        result.selected = SelectedChannel.create(name, chan)
+        # Sampling callbacks are registered on the loop that channel values
+        # are updated on.
+        selected = SelectedChannel.create(name, chan)
+        result.selected = SelectedChannels([selected])
+        result.model.call_soon(selected.enable_sampling)
 
         return result
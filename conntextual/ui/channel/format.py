@@ -0,0 +1,98 @@
+"""
+A module implementing channel-table value formatting.
+"""
+
+# built-in
+from functools import partial
+from typing import Any, Callable, Optional, Union
+
+# third-party
+from rich.text import Text
+from runtimepy.channel import AnyChannel
+from runtimepy.enum import RuntimeEnum
+from runtimepy.primitives.field import BitField
+from runtimepy.primitives.scaling import ChannelScaling, apply
+
+CellValue = Union[str, Text]
+
+# Get a row's (unscaled and unresolved) value.
+ValueGetter = Callable[[], Any]
+
+# Format a row's value (as returned by its getter) for display.
+Formatter = Callable[[Any], str]
+
+
+def format_float(value: float) -> str:
+    """Format a floating-point value."""
+    return f"{value: 15.6f}"
+
+
+def format_int(value: int) -> str:
+    """Format an integer value."""
+    return f"{value: 8d}       "
+
+
+def format_bool(value: bool) -> str:
+    """Format a boolean value."""
+    return "true" if value else "false"
+
+
+def format_value(value: Any) -> str:
+    """Format a value based on its type."""
+
+    result = value
+    if isinstance(value, float):
+        result = format_float(value)
+    elif isinstance(value, bool):
+        result = format_bool(value)
+    elif isinstance(value, int):
+        result = format_int(value)
+
+    return str(result)
+
+
+def format_scaled(value: Any, scaling: ChannelScaling) -> str:
+    """Format a value after applying a scaling polynomial."""
+    return format_value(apply(value, scaling))
+
+
+def channel_formatter(
+    chan: AnyChannel, enum: Optional[RuntimeEnum]
+) -> tuple[ValueGetter, Formatter]:
+    """Get a value getter and formatter for a channel."""
+
+    primitive = chan.raw
+    kind = primitive.kind
+    scaling = primitive.scaling
+
+    formatter: Formatter
+
+    if enum is not None:
+        formatter = enum.get_str
+    elif scaling:
+        formatter = partial(format_scaled, scaling=scaling)
+    elif kind.is_float:
+        formatter = format_float
+    elif kind.is_boolean:
+        formatter = format_bool
+    else:
+        formatter = format_int
+
+    return primitive, formatter
+
+
+def field_formatter(
+    field: BitField, enum: Optional[RuntimeEnum]
+) -> tuple[ValueGetter, Formatter]:
+    """Get a value getter and formatter for a bit field."""
+
+    formatter: Formatter
+
+    if enum is not None:
+        formatter = enum.get_str
+    elif field.width == 1:
+        formatter = format_bool
+    else:
+        formatter = format_int
+
+    return field, formatter
@@ -3,8 +3,12 @@ A module impementing a channel-environment log widget.
 """
 
 # built-in
-from logging import ERROR, INFO, Formatter, Logger
-from typing import Optional
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from logging import ERROR, INFO, Formatter, Logger, LogRecord
+from threading import Lock
+from typing import Deque, Iterable, List, Optional
 
 # third-party
 from textual import on
@@ -19,12 +23,82 @@ from vcorelib.logging import (
 )
 
 # internal
+from conntextual.ui.channel.metrics import FrameMetrics
+from conntextual.ui.channel.model import call_soon
 from conntextual.ui.channel.suggester import CommandSuggester
 from conntextual.util import css_name
 
 MAX_LINES = 1000
 
 
+@dataclass
+class LogBuffer:
+    """
+    A bounded buffer of formatted log lines (that haven't been written to a
+    log widget yet).
+    """
+
+    queue: LogRecordQueue
+    lines: Deque[str]
+
+    # Lines are buffered on the loop that channel values are updated on, and
+    # written (or restored) on the application's (which can be another
+    # thread's).
+    lock: Lock = field(default_factory=Lock)
+
+    @staticmethod
+    def create(logger: LoggerType, max_lines: int = MAX_LINES) -> "LogBuffer":
+        """Create a log buffer (and start handling log records)."""
+
+        queue, handler = queue_handler(logger, root_formatter=False)
+        handler.setFormatter(Formatter(DEFAULT_TIME_FORMAT))
+        if logger is not Logger.root:
+            logger.info("Queue handler initialized.")
+
+        return LogBuffer(queue, deque(maxlen=max_lines))
+
+    def drain(self) -> int:
+        """
+        Move all queued log records into the line buffer. Returns the number
+        of lines that were dropped (because the line buffer is full).
+        """
+
+        # Only the newest records are formatted (older ones would be dropped
+        # from the line buffer right away).
+        records: Deque[LogRecord] = deque(maxlen=self.lines.maxlen)
+        received = 0
+        while not self.queue.empty():
+            records.append(self.queue.get_nowait())
+            received += 1
+
+        formatted = [x.getMessage() for x in records]
+
+        with self.lock:
+            lines = self.lines
+            count = len(lines)
+            lines.extend(formatted)
+
+        return count + received - len(lines)
+
+    def restore(self, lines: Iterable[str]) -> None:
+        """
+        Return lines (that were already written to a log widget) to the front
+        of the buffer, so that they're written again to a new log widget.
+        """
+
+        with self.lock:
+            restored = deque(lines, maxlen=self.lines.maxlen)
+            restored.extend(self.lines)
+            self.lines = restored
+
+    def pop(self, count: int) -> List[str]:
+        """Remove (up to) a number of the oldest lines from the buffer."""
+
+        with self.lock:
+            lines = self.lines
+            return [lines.popleft() for _ in range(min(count, len(lines)))]
+
+
 class InputWithHistory(Input):
     """An input with last-command history."""
 
@@ -46,42 +120,51 @@ class ChannelEnvironmentLog(Static):
 
     parent_name: str
     logger: LoggerType
-    queue: LogRecordQueue
+    buffer: LogBuffer
     suggester: Optional[CommandSuggester]
 
-    def dispatch(self) -> None:
-        """Dispatch the log updater."""
+    # Commands are run on the event loop that channel values are updated on
+    # (if it's not this widget's).
+    loop: Optional[asyncio.AbstractEventLoop] = None
 
-        log = self.query_one(Log)
-        while not self.queue.empty():
-            log.write_line(self.queue.get_nowait().getMessage())
+    def dispatch(self, metrics: FrameMetrics, max_records: int) -> None:
+        """
+        Dispatch the log updater. At most 'max_records' buffered log lines
+        are written per dispatch, any others are deferred to the next one.
+        """
+
+        # The budget is commandable (at least one line is always written, so
+        # that the log doesn't stop updating).
+        lines = self.buffer.pop(max(max_records, 1))
+        if lines:
+            self.query_one(Log).write_lines(lines)
+
+        metrics.log_records.value = len(lines)
+        metrics.log_records_deferred.value = len(self.buffer.lines)
 
     @on(Input.Submitted)
     def handle_submit(self, event: Input.Submitted) -> None:
         """Handle input submission."""
 
         self.query_one(InputWithHistory).previous = event.value
-        assert self.suggester is not None
-        result = self.suggester.processor.command(event.value)
-
-        self.logger.log(
-            INFO if result else ERROR, "%s: %s", event.value, result
-        )
+        call_soon(self.loop, self.run_command, event.value)
 
         # Reset input.
         node = self.query_one(Input)
         node.action_home()
         node.action_delete_right_all()
 
+    def run_command(self, command: str) -> None:
+        """Run a command (and log the result)."""
+
+        assert self.suggester is not None
+        result = self.suggester.processor.command(command)
+
+        self.logger.log(INFO if result else ERROR, "%s: %s", command, result)
+
     def compose(self) -> ComposeResult:
         """Create child nodes."""
 
-        # Initialize logger handling.
-        self.queue, handler = queue_handler(self.logger, root_formatter=False)
-        handler.setFormatter(Formatter(DEFAULT_TIME_FORMAT))
-        if self.logger is not Logger.root:
-            self.logger.info("Queue handler initialized.")
-
         if self.suggester is not None:
             input_box = InputWithHistory(
                 "set ",
@@ -0,0 +1,134 @@
+"""
+A module implementing metrics for channel-environment display updates.
+"""
+
+# built-in
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Iterator
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.primitives import Double, Uint32
+
+# The weight of the most recent measurement in moving averages.
+EWMA_ALPHA = 0.1
+
+# Metrics produced by applying display updates (which may happen on another
+# thread).
+DISPLAY_COUNTERS = ["cells_updated", "log_records", "log_records_deferred"]
+DISPLAY_STAGES = ["table", "log", "plot", "dispatch"]
+
+
+@dataclass
+class StageTiming:
+    """Timing metrics (in milliseconds) for a stage of a display update."""
+
+    last: Double
+    ewma: Double
+    max: Double
+
+    @staticmethod
+    def create() -> "StageTiming":
+        """Create a stage-timing instance."""
+        return StageTiming(Double(), Double(), Double())
+
+    def register(self, env: ChannelEnvironment, name: str) -> None:
+        """Register channels for these metrics."""
+
+        env.channel(f"{name}_ms", self.last)
+        env.channel(f"{name}_ewma_ms", self.ewma)
+        env.channel(f"{name}_max_ms", self.max)
+
+    def update(self, elapsed_ms: float) -> None:
+        """Update these metrics with a new measurement."""
+
+        self.last.value = elapsed_ms
+
+        self.max.value = max(self.max.value, elapsed_ms)
+
+        self.ewma.value += EWMA_ALPHA * (elapsed_ms - self.ewma.value)
+
+    def assign(self, other: "StageTiming") -> None:
+        """Assign values from another instance."""
+
+        self.last.value = other.last.value
+        self.ewma.value = other.ewma.value
+        self.max.value = other.max.value
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Measure the duration of a stage."""
+
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.update((perf_counter_ns() - start) / 1e6)
+
+
+@dataclass
+class FrameMetrics:
+    """Metrics for the most recent channel-environment display update."""
+
+    cells_updated: Uint32
+    log_records: Uint32
+    log_records_deferred: Uint32
+
+    # Total (since the application started).
+    log_records_dropped: Uint32
+    plot_samples: Uint32
+
+    capture: StageTiming
+    table: StageTiming
+    log: StageTiming
+    plot: StageTiming
+    housekeeping: StageTiming
+    dispatch: StageTiming
+
+    @staticmethod
+    def create() -> "FrameMetrics":
+        """Create a frame-metrics instance."""
+
+        return FrameMetrics(
+            Uint32(),
+            Uint32(),
+            Uint32(),
+            Uint32(),
+            Uint32(),
+            StageTiming.create(),
+            StageTiming.create(),
+            StageTiming.create(),
+            StageTiming.create(),
+            StageTiming.create(),
+            StageTiming.create(),
+        )
+
+    def register(self, env: ChannelEnvironment) -> None:
+        """Register channels for these metrics."""
+
+        env.channel("cells_updated", self.cells_updated)
+        env.channel("log_records", self.log_records)
+        env.channel("log_records_deferred", self.log_records_deferred)
+        env.channel("log_records_dropped", self.log_records_dropped)
+        env.channel("plot_samples", self.plot_samples)
+
+        self.capture.register(env, "capture_time")
+        self.table.register(env, "table_time")
+        self.log.register(env, "log_time")
+        self.plot.register(env, "plot_time")
+        self.housekeeping.register(env, "housekeeping_time")
+        self.dispatch.register(env, "dispatch_time")
+
+    def assign_display(self, other: "FrameMetrics") -> None:
+        """
+        Assign display-update metrics from another instance (e.g. one that's
+        updated on another thread).
+        """
+
+        for name in DISPLAY_COUNTERS:
+            getattr(self, name).value = getattr(other, name).value
+
+        for name in DISPLAY_STAGES:
+            getattr(self, name).assign(getattr(other, name))
@@ -3,8 +3,10 @@ A module implementing a data model for channel environments.
 """
 
 # built-in
+import asyncio
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import Any, Callable, Optional
 
 # third-party
 from runtimepy.channel.environment import ChannelEnvironment
@@ -21,6 +23,23 @@ class ChannelEnvironmentSource(StrEnum):
     TASK = "task"
     CONNECTION_LOCAL = "local connection"
     CONNECTION_REMOTE = "remote connection"
+    OVERVIEW = "overview"
+
+
+def call_soon(
+    loop: Optional[asyncio.AbstractEventLoop],
+    callback: Callable[..., None],
+    *args: Any,
+) -> None:
+    """
+    Run a callback on an event loop (that may belong to another thread), or
+    immediately if no loop is provided.
+    """
+
+    if loop is None:
+        callback(*args)
+    else:
+        loop.call_soon_threadsafe(callback, *args)
 
 
 @dataclass
@@ -33,6 +52,17 @@ class Model:
     logger: LoggerType
     app: AppInfo
 
+    # The event loop that channel values are updated on, if display updates
+    # are applied on another thread (state that's shared with channel
+    # updates, e.g. plot sampling, is only changed on this loop).
+    loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def call_soon(self, callback: Callable[..., None], *args: Any) -> None:
+        """
+        Run a callback on the event loop that channel values are updated on.
+        """
+        call_soon(self.loop, callback, *args)
+
     @property
     def env(self) -> ChannelEnvironment:
         """Get the channel environment."""
@@ -4,10 +4,50 @@ A module implementing an include/exclude pattern matching interface.
 
 # built-in
 import re
-from typing import List, NamedTuple, Optional, Union
+from typing import List, NamedTuple, Optional, Tuple, Union
 
 PatternList = List[re.Pattern[str]]
 StringOrList = Union[str, List[str]]
+PatternKey = Tuple[Tuple[re.Pattern[str], ...], Tuple[re.Pattern[str], ...]]
+
+# Patterns that use backreferences (or conditional groups) can't be combined
+# (group numbers would change).
+BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Memoized match results (by patterns and string), up to a maximum number.
+MATCHES: dict[Tuple[PatternKey, str], bool] = {}
+CACHE_SIZE = 2**16
+
+
+def combine(patterns: PatternList) -> Optional[re.Pattern[str]]:
+    """
+    Attempt to combine patterns into a single (alternation) pattern. Returns
+    None if the patterns can't be combined.
+    """
+
+    flags = {x.flags for x in patterns}
+    if len(flags) != 1 or any(
+        BACKREFERENCE.search(x.pattern) for x in patterns
+    ):
+        return None
+
+    try:
+        return re.compile(
+            "|".join(f"(?:{x.pattern})" for x in patterns), flags.pop()
+        )
+    except re.error:
+        return None
+
+
+def search(
+    combined: Optional[re.Pattern[str]], patterns: PatternList, data: str
+) -> bool:
+    """Determine if any pattern matches a string."""
+
+    if combined is not None:
+        return combined.search(data) is not None
+
+    return any(pattern.search(data) is not None for pattern in patterns)
 
 
 class PatternPair(NamedTuple):
@@ -16,25 +56,57 @@ class PatternPair(NamedTuple):
     includes: PatternList
     excludes: PatternList
 
+    # Combined patterns (if the individual patterns could be combined).
+    include: Optional[re.Pattern[str]] = None
+    exclude: Optional[re.Pattern[str]] = None
+
+    @property
+    def key(self) -> PatternKey:
+        """Get a (hashable) key for this pattern pair's patterns."""
+        return tuple(self.includes), tuple(self.excludes)
+
     def matches(self, data: str) -> bool:
         """Determine whether or not a string matches this pattern pair."""
 
+        key = (self.key, data)
+        result = MATCHES.get(key)
+
+        if result is None:
+            result = self.matches_uncached(data)
+            if len(MATCHES) < CACHE_SIZE:
+                MATCHES[key] = result
+
+        return result
+
+    def matches_uncached(self, data: str) -> bool:
+        """
+        Determine whether or not a string matches this pattern pair (without
+        using or updating memoized results).
+        """
+
         include_result = True
 
         if self.includes:
-            include_result = any(
-                include.search(data) is not None for include in self.includes
-            )
+            include_result = search(self.include, self.includes, data)
 
         exclude_result = False
 
-        if include_result:
-            exclude_result = any(
-                exclude.search(data) is not None for exclude in self.excludes
-            )
+        if include_result and self.excludes:
+            exclude_result = search(self.exclude, self.excludes, data)
 
         return include_result and not exclude_result
 
+    @staticmethod
+    def create(includes: PatternList, excludes: PatternList) -> "PatternPair":
+        """Create a pattern pair."""
+
+        return PatternPair(
+            includes,
+            excludes,
+            combine(includes) if includes else None,
+            combine(excludes) if excludes else None,
+        )
+
     @staticmethod
     def from_dict(data: dict[str, StringOrList]) -> "PatternPair":
         """Create a pattern pair from dictionary data."""
@@ -57,4 +129,4 @@ class PatternPair(NamedTuple):
                     else:
                         patterns += [re.compile(x) for x in pattern]
 
-        return PatternPair(includes, excludes)
+        return PatternPair.create(includes, excludes)
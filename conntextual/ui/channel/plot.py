@@ -2,18 +2,23 @@
 A module implementing a plot widget.
 """
 
+# built-in
+from typing import Any, List, Optional
+
 # third-party
-from numpy.typing import ArrayLike
 from textual_plotext import PlotextPlot
 
+# internal
+from conntextual.ui.channel.decimate import decimate, plot_columns
+from conntextual.ui.channel.selected import PlotSeries
+
 
 class Plot(PlotextPlot):
     """A plot widget."""
 
     def __init__(
         self,
-        x: ArrayLike,
-        y: ArrayLike,
+        series: List[PlotSeries],
         theme: str,
         marker: str,
         *args,
@@ -23,12 +28,17 @@ class Plot(PlotextPlot):
         """Initialize this instance."""
 
         super().__init__(*args, **kwargs)
-        self.x = x
-        self.y = y
+        self.series = series
         self.title = title
         self.plot_theme = theme
         self.plot_marker = marker
 
+        # Horizontal plot resolution (data is decimated to this).
+        self.columns = 0
+
+        # Everything that the last drawn instance of the plot depended on.
+        self.drawn: Optional[tuple[Any, ...]] = None
+
     def on_show(self) -> None:
         """Handle showing the plot."""
 
@@ -37,6 +47,7 @@ class Plot(PlotextPlot):
     def on_resize(self) -> None:
         """Handle re-size."""
 
+        self.columns = plot_columns(self.size.width, self.plot_marker)
         self.dispatch()
 
     def on_mount(self) -> None:
@@ -54,15 +65,33 @@ class Plot(PlotextPlot):
         self.plt.title(self.title)
 
     def dispatch(self) -> None:
-        """Draw a new instance of the plot."""
-
+        """
+        Draw a new instance of the plot (if anything changed since the last
+        one was drawn).
+        """
+
+        drawn = (
+            tuple((x.name, x.generation) for x in self.series),
+            self.columns,
+            self.title,
+            self.plot_theme,
+        )
+        if drawn == self.drawn:
+            return
+        self.drawn = drawn
+
+        # Series aren't labeled (plotext legends don't render reliably in
+        # small plots), the title lists series names in plotting order.
         self.plt.clear_data()
-        self.plt.plot(self.x, self.y, marker=self.plot_marker)  # type: ignore
+        for series in self.series:
+            x, y = decimate(series.x, series.y, self.columns)
+            self.plt.plot(
+                x, y, marker=self.plot_marker  # type: ignore[arg-type]
+            )
         self.refresh()
 
-    def set_data(self, x: ArrayLike, y: ArrayLike) -> None:
+    def set_data(self, series: List[PlotSeries]) -> None:
         """Assign new data."""
 
-        self.x = x
-        self.y = y
+        self.series = series
         self.dispatch()
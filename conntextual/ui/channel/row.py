@@ -0,0 +1,118 @@
+"""
+A module implementing change tracking for channel-table rows.
+"""
+
+# built-in
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# third-party
+import numpy as np
+from numpy.typing import NDArray
+from rich.text import Text
+from runtimepy.primitives import AnyPrimitive
+from runtimepy.registry.name import RegistryKey
+from textual.coordinate import Coordinate
+from vcorelib.math import to_nanos
+
+# internal
+from conntextual.ui.channel.format import (
+    CellValue,
+    Formatter,
+    ValueGetter,
+    format_value,
+)
+
+STALE_THRESHOLD_NS = to_nanos(0.5)
+
+
+@dataclass
+class ChannelRow:
+    """A container for tracking the displayed state of a table row."""
+
+    coordinate: Coordinate
+    key: RegistryKey
+    primitive: AnyPrimitive
+
+    value: ValueGetter
+    formatter: Formatter
+
+    # The value and staleness state of the last rendered cell.
+    rendered_value: Any = None
+    rendered_stale: Optional[bool] = None
+    text: str = ""
+    cell: Optional[CellValue] = None
+
+    @staticmethod
+    def create(
+        coordinate: Coordinate,
+        key: RegistryKey,
+        primitive: AnyPrimitive,
+        value: ValueGetter = None,
+        formatter: Formatter = format_value,
+    ) -> "ChannelRow":
+        """Create a channel-row instance."""
+
+        return ChannelRow(
+            coordinate,
+            key,
+            primitive,
+            value if value is not None else primitive,
+            formatter,
+        )
+
+    def render(self, value: Any, stale: bool) -> Optional[CellValue]:
+        """
+        Get a new cell for this row, or None if the cell that was last
+        rendered is still current.
+        """
+
+        if self.cell is not None and value == self.rendered_value:
+            if stale == self.rendered_stale:
+                return None
+        else:
+            self.text = self.formatter(value)
+            self.rendered_value = value
+
+        self.rendered_stale = stale
+        self.cell = Text(self.text, style="yellow") if stale else self.text
+        return self.cell
+
+
+class RowStates:
+    """
+    The primitive timestamps and staleness states that were last polled for
+    a set of rows (as arrays, indexed by row).
+    """
+
+    def __init__(self, count: int) -> None:
+        """Initialize this instance."""
+
+        # The initial timestamps force the first poll to render all cells.
+        self.last_updated_ns = np.full(count, -1, dtype=np.int64)
+        self.stale = np.zeros(count, dtype=np.bool_)
+
+    def poll(
+        self, window: slice, timestamps: NDArray[np.int64], now_ns: int
+    ) -> tuple[NDArray[np.intp], NDArray[np.bool_]]:
+        """
+        Poll a window of rows (given their current timestamps). Returns the
+        indices (relative to the start of the window) of rows whose cells
+        need to be re-rendered (because their value or staleness changed),
+        and the staleness of all rows in the window.
+        """
+
+        stale = (now_ns - timestamps) > STALE_THRESHOLD_NS
+
+        # Basic slicing produces views (that are updated in place).
+        last_updated_ns = self.last_updated_ns[window]
+        last_stale = self.stale[window]
+
+        changed = np.flatnonzero(
+            (timestamps != last_updated_ns) | (stale != last_stale)
+        )
+
+        last_updated_ns[:] = timestamps
+        last_stale[:] = stale
+
+        return changed, stale
@@ -0,0 +1,256 @@
+"""
+A module implementing a channel-name index (for incremental search and
+command completion).
+"""
+
+# built-in
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+# third-party
+import numpy as np
+from numpy.typing import NDArray
+
+# Search terms are looked up by their substrings of this length (postings
+# for each one are only built when it's first searched for).
+GRAM_SIZE = 3
+
+# The maximum number of matches kept for a query.
+MAX_MATCHES = 100
+
+
+def grams(value: str, size: int = GRAM_SIZE) -> Iterable[str]:
+    """Get the substrings of a string of a certain length."""
+
+    for start in range(len(value) - size + 1):
+        yield value[start : start + size]
+
+
+class NameIndex:
+    """
+    An index of names for incremental, case-insensitive search (names that
+    contain every whitespace-separated search term match) and prefix
+    completion. Lookup structures are built when they're first used.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """Initialize this instance."""
+
+        self.names = list(names)
+
+        # Postings (arrays of ranks) for substrings that were searched for.
+        self.postings: Dict[str, NDArray[np.int64]] = {}
+
+    @cached_property
+    def order(self) -> List[int]:
+        """Name indices, ranked by name length (then by index)."""
+
+        names = self.names
+        return sorted(range(len(names)), key=lambda x: (len(names[x]), x))
+
+    @cached_property
+    def ranked(self) -> List[str]:
+        """Folded names in rank order."""
+        return [self.names[x].lower() for x in self.order]
+
+    @cached_property
+    def sorted_names(self) -> List[str]:
+        """Names in sorted order (for prefix completion)."""
+        return sorted(self.names)
+
+    @cached_property
+    def sorted_folded(self) -> List[str]:
+        """Folded names in sorted order (for prefix lookups)."""
+        return sorted(self.ranked)
+
+    @cached_property
+    def folded_ranks(self) -> NDArray[np.int64]:
+        """Ranks of folded names in sorted order."""
+
+        ranked = self.ranked
+        return np.array(
+            sorted(range(len(ranked)), key=ranked.__getitem__),
+            dtype=np.int64,
+        )
+
+    def posting(self, gram: str) -> NDArray[np.int64]:
+        """Get ranks of names that contain a (folded) substring."""
+
+        result = self.postings.get(gram)
+        if result is None:
+            result = np.flatnonzero(
+                np.fromiter(
+                    (gram in x for x in self.ranked),
+                    dtype=np.bool_,
+                    count=len(self.ranked),
+                )
+            )
+            self.postings[gram] = result
+
+        return result
+
+    def candidates(self, terms: List[str]) -> Sequence[int]:
+        """
+        Get ranks of names that may contain every (folded) search term (all
+        names if no term is long enough to be looked up).
+        """
+
+        result: Optional[NDArray[np.int64]] = None
+
+        # Intersect the smallest postings first.
+        for posting in sorted(
+            (self.posting(x) for term in terms for x in set(grams(term))),
+            key=len,
+        ):
+            result = (
+                posting
+                if result is None
+                else np.intersect1d(result, posting, assume_unique=True)
+            )
+            if not result.size:
+                break
+
+        return range(len(self.ranked)) if result is None else result.tolist()
+
+    def matching(
+        self, terms: List[str], ranks: Iterable[int]
+    ) -> Iterator[int]:
+        """Get the ranks of names that contain every search term."""
+
+        ranked = self.ranked
+        for rank in ranks:
+            name = ranked[rank]
+            if all(term in name for term in terms):
+                yield rank
+
+    def matches(self, query: str) -> Iterator[int]:
+        """
+        Get indices of names matching a query. Names that start with the
+        first search term are first, then shorter names.
+        """
+
+        terms = query.lower().split()
+        if not terms:
+            return
+
+        order = self.order
+        first = terms[0]
+
+        # Names (in sorted order) that start with the first term.
+        start = bisect_left(self.sorted_folded, first)
+        end = bisect_left(self.sorted_folded, first + "\U0010ffff", lo=start)
+        for rank in self.matching(
+            terms, np.sort(self.folded_ranks[start:end]).tolist()
+        ):
+            yield order[rank]
+
+        ranked = self.ranked
+        for rank in self.matching(terms, self.candidates(terms)):
+            if not ranked[rank].startswith(first):
+                yield order[rank]
+
+    def search(self, query: str, limit: int = None) -> List[int]:
+        """Get indices of names matching a query (up to a limit)."""
+        return list(islice(self.matches(query), limit))
+
+    def complete(
+        self, prefix: str, prefer: Callable[[str], bool] = None
+    ) -> Optional[str]:
+        """
+        Get the shortest name that starts with a prefix (the shortest one
+        that's also preferred, if there is one).
+        """
+
+        start = bisect_left(self.sorted_names, prefix)
+
+        result = None
+        preferred = None
+
+        for name in self.sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+
+            if result is None or len(name) < len(result):
+                result = name
+
+            if (
+                prefer is not None
+                and (preferred is None or len(name) < len(preferred))
+                and prefer(name)
+            ):
+                preferred = name
+
+        return preferred if preferred is not None else result
+
+
+@dataclass
+class ChannelSearch:
+    """Incremental search state for a channel table."""
+
+    index: NameIndex
+
+    # Table rows of indexed names (names can be excluded from the table).
+    rows: Dict[int, int]
+
+    # The current query, rows that match it (best match first) and the
+    # position of the last row that was jumped to.
+    query: str
+    matches: List[int]
+    position: int
+
+    def find(self, query: str) -> Optional[int]:
+        """
+        Get the best matching row for a new query, or the next matching row
+        if the query is unchanged.
+        """
+
+        if query == self.query:
+            return self.next()
+
+        self.query = query
+        return self.update(query)
+
+    def update(self, query: str) -> Optional[int]:
+        """
+        Search for a query. Returns the best match's row (if any). At most
+        MAX_MATCHES rows are matched.
+        """
+
+        rows = self.rows
+        self.matches = list(
+            islice(
+                (
+                    rows[idx]
+                    for idx in self.index.matches(query)
+                    if idx in rows
+                ),
+                MAX_MATCHES,
+            )
+        )
+        self.position = 0
+        return self.matches[0] if self.matches else None
+
+    def next(self) -> Optional[int]:
+        """Get the next matching row (wrapping around)."""
+
+        if not self.matches:
+            return None
+
+        self.position = (self.position + 1) % len(self.matches)
+        return self.matches[self.position]
+
+    @staticmethod
+    def create(names: Iterable[str]) -> "ChannelSearch":
+        """Create a channel-search instance."""
+        return ChannelSearch(NameIndex(names), {}, "", [], 0)
@@ -4,12 +4,29 @@ A module implementing an interface for channel selection.
 
 # built-in
 from dataclasses import dataclass
-from typing import List, Union
+from typing import Any, List, NamedTuple, Optional
 
 # third-party
+import numpy as np
+from numpy.typing import NDArray
 from runtimepy.channel.environment.base import ChannelResult
 from vcorelib.math.time import default_time_ns
 
+# internal
+from conntextual.ui.channel.buffer import SampleBuffer, sample_dtype
+
+# The maximum number of channels that can be plotted at once.
+MAX_SELECTED = 8
+
+
+class PlotSeries(NamedTuple):
+    """A container for plot-series data."""
+
+    x: NDArray[np.float64]
+    y: NDArray[np.generic]
+    name: str
+    generation: int
+
 
 @dataclass
 class SelectedChannel:
@@ -17,38 +34,192 @@ class SelectedChannel:
 
     name: str
     channel: ChannelResult
-    timestamps: List[float]
-    values: List[Union[float, int, bool]]
+    buffer: SampleBuffer
     start_ns: int
+    last_updated_ns: int = -1
+    callback: Optional[int] = None
+
+    # Samples taken since the last poll.
+    samples: int = 0
 
     @staticmethod
     def create(name: str, channel: ChannelResult) -> "SelectedChannel":
         """Create a selected-channel instance."""
 
-        return SelectedChannel(name, channel, [], [], default_time_ns())
+        return SelectedChannel(
+            name,
+            channel,
+            SampleBuffer(sample_dtype(channel[0].raw)),
+            default_time_ns(),
+        )
 
-    def reset(self) -> None:
+    @property
+    def timestamps(self) -> NDArray[np.float64]:
+        """Get sample timestamps (seconds since the start time)."""
+        return self.buffer.timestamps
+
+    @property
+    def values(self) -> NDArray[np.generic]:
+        """Get sample values."""
+        return self.buffer.values
+
+    @property
+    def series(self) -> PlotSeries:
+        """Get this channel's plot-series data."""
+        return PlotSeries(
+            self.timestamps, self.values, self.name, self.buffer.generation
+        )
+
+    def reset(self, start_ns: int = None) -> None:
         """Reset this channel's start time."""
 
-        self.timestamps = []
-        self.values = []
-        self.start_ns = default_time_ns()
+        self.buffer.clear()
+        self.last_updated_ns = -1
+        self.start_ns = start_ns if start_ns is not None else default_time_ns()
+
+    def _handle_change(self, _: Any, __: Any) -> None:
+        """Handle the underlying channel's value changing."""
+        self.sample(force=True)
+
+    def enable_sampling(self) -> None:
+        """
+        Sample the underlying channel whenever its value changes (independent
+        of polling).
+        """
+
+        if self.callback is None:
+            self.callback = self.channel[0].raw.register_callback(
+                self._handle_change
+            )
+
+    def disable_sampling(self) -> None:
+        """Stop sampling the underlying channel on value changes."""
+
+        if self.callback is not None:
+            self.channel[0].raw.remove_callback(self.callback)
+            self.callback = None
+
+    def sample(self, force: bool = False) -> None:
+        """Sample the underlying channel if it was updated."""
+
+        raw = self.channel[0].raw
+        last_updated = raw.last_updated_ns
+
+        if force or last_updated > self.last_updated_ns:
+            self.last_updated_ns = last_updated
+            self.buffer.append(
+                (last_updated - self.start_ns) / 1e9, raw.scaled
+            )
+            self.samples += 1
+
+
+@dataclass
+class SelectedChannels:
+    """A container for the set of channels selected for plotting."""
+
+    channels: List[SelectedChannel]
+
+    @property
+    def title(self) -> str:
+        """Get a plot title for these channels."""
+        return ", ".join(x.name for x in self.channels)
+
+    @property
+    def series(self) -> List[PlotSeries]:
+        """Get plot-series data for these channels."""
+        return [x.series for x in self.channels]
+
+    def copy_series(self, previous: List[PlotSeries]) -> List[PlotSeries]:
+        """
+        Get copies of plot-series data for these channels (e.g. for use on
+        another thread), re-using previous copies that are still current.
+        """
+
+        current = {(x.name, x.generation): x for x in previous}
+
+        result = []
+        for channel in self.channels:
+            series = current.get((channel.name, channel.buffer.generation))
+            if series is None:
+                series = PlotSeries(
+                    channel.timestamps.copy(),
+                    channel.values.copy(),
+                    channel.name,
+                    channel.buffer.generation,
+                )
+            result.append(series)
+
+        return result
+
+    def find(self, name: str) -> Optional[SelectedChannel]:
+        """Find a selected channel by name."""
+
+        for channel in self.channels:
+            if channel.name == name:
+                return channel
+
+        return None
+
+    def select(self, channel: SelectedChannel) -> None:
+        """Select a single channel (de-selecting all others)."""
+
+        for selected in self.channels:
+            selected.disable_sampling()
+
+        self.channels = [channel]
+        channel.enable_sampling()
+
+    def toggle(self, channel: SelectedChannel) -> bool:
+        """
+        Add a channel to (or remove it from) this set. Returns whether or not
+        the set changed (the last channel can't be removed and at most
+        MAX_SELECTED channels can be selected).
+        """
+
+        result = False
+
+        # Channels are selected by name (the same channel may be selected via
+        # another instance).
+        selected = self.find(channel.name)
+
+        if selected is not None:
+            if len(self.channels) > 1:
+                selected.disable_sampling()
+                self.channels.remove(selected)
+                result = True
+
+        elif len(self.channels) < MAX_SELECTED:
+            self.channels.append(channel)
+            channel.enable_sampling()
+            result = True
+
+        return result
+
+    def reset(self) -> None:
+        """Reset all channels (to a shared start time)."""
+
+        start_ns = default_time_ns()
+        for channel in self.channels:
+            channel.reset(start_ns=start_ns)
+
+    def poll(self, max_plot_samples: int) -> int:
+        """
+        Poll all channels. Returns the number of samples taken since the last
+        poll.
+        """
+
+        result = 0
 
-    def poll(self, max_plot_samples: int) -> None:
-        """Poll the underlying channel."""
+        for channel in self.channels:
+            # Older samples are discarded if this is lower than the number of
+            # samples currently held.
+            channel.buffer.resize(max_plot_samples)
 
-        chan = self.channel[0]
-        last_updated = chan.raw.last_updated_ns
+            # Catch updates that didn't change the value (these don't trigger
+            # sampling callbacks).
+            channel.sample()
 
-        # Need to handle not infinitely growing.
-        if (not self.timestamps) or last_updated > self.timestamps[-1]:
-            self.timestamps.append((last_updated - self.start_ns) / 1e9)
-            self.values.append(chan.raw.scaled)
+            result += channel.samples
+            channel.samples = 0
 
-        # Check if there are more data points than the specified max. If so,
-        # remove the oldest data.
-        to_truncate = len(self.timestamps) - max_plot_samples
-        while to_truncate > 0:
-            self.values.pop(0)
-            self.timestamps.pop(0)
-            to_truncate -= 1
+        return result
@@ -0,0 +1,168 @@
+"""
+A module implementing channel-value snapshots (for applying display updates
+on another thread).
+"""
+
+# built-in
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Generic, List, NamedTuple, Optional, TypeVar
+
+# third-party
+import numpy as np
+from numpy.typing import NDArray
+
+# internal
+from conntextual.ui.channel.row import ChannelRow, RowStates
+from conntextual.ui.channel.selected import PlotSeries
+
+T = TypeVar("T")
+
+
+class FrameOptions(NamedTuple):
+    """Options for a display update."""
+
+    max_plot_samples: int
+    max_log_records: int
+    update_table: bool = True
+    update_log: bool = True
+    update_plot: bool = True
+    visible_only: bool = False
+
+
+class RowValues:
+    """
+    Raw values and timestamps of a set of rows, captured once per frame
+    (that row polling, staleness detection and rendering all read by index).
+    """
+
+    def __init__(self, rows: List[ChannelRow]) -> None:
+        """Initialize this instance."""
+
+        self.rows = rows
+        self.primitives = [row.primitive for row in rows]
+        self.getters = [row.value for row in rows]
+
+        # Values are only read for rows whose timestamp changed (the initial
+        # timestamps force all values to be read by the first capture).
+        self.timestamps = np.full(len(rows), -1, dtype=np.int64)
+        self.values: List[Any] = [None] * len(rows)
+
+    def capture(self, window: slice) -> tuple[NDArray[np.int64], List[Any]]:
+        """
+        Capture the timestamps (in one pass) and updated values of a window
+        of rows. Returns the window's timestamps and (a copy of its) values.
+        """
+
+        primitives = self.primitives[window]
+        timestamps = np.fromiter(
+            (x.last_updated_ns for x in primitives),
+            dtype=np.int64,
+            count=len(primitives),
+        )
+
+        # Basic slicing produces a view (that's updated in place).
+        last = self.timestamps[window]
+        start = window.indices(len(self.rows))[0]
+
+        values = self.values
+        getters = self.getters
+        for idx in (np.flatnonzero(timestamps != last) + start).tolist():
+            values[idx] = getters[idx]()
+
+        last[:] = timestamps
+
+        return timestamps, values[window]
+
+
+@dataclass
+class CaptureState:
+    """State for capturing (and applying) snapshots of a channel table."""
+
+    # Row values (captured where channel values are updated), and the row
+    # state that was last polled (where display updates are applied).
+    values: RowValues
+    states: RowStates
+
+    # The rows that were last scrolled into view, and the plot data that was
+    # last copied.
+    in_view: slice
+    plotted: List[PlotSeries]
+
+    @staticmethod
+    def create(rows: List[ChannelRow]) -> "CaptureState":
+        """Create a capture-state instance."""
+
+        return CaptureState(
+            RowValues(rows), RowStates(len(rows)), slice(None), []
+        )
+
+
+@dataclass
+class FrameSnapshot:
+    """
+    Channel-environment state captured (on the event loop that channel
+    values are updated on) for a single display update.
+    """
+
+    # The environment's rows when this snapshot was captured (snapshots of
+    # rows that were since removed are discarded), and the captured ones.
+    rows: List[ChannelRow]
+    window: slice
+    now_ns: int
+
+    # Captured row timestamps and values (timestamps are None if the table
+    # isn't updated).
+    timestamps: Optional[NDArray[np.int64]]
+    values: List[Any]
+
+    # Plot data (None if the plot isn't updated).
+    title: str
+    series: Optional[List[PlotSeries]]
+    plot_samples: int
+
+    # The maximum number of buffered log lines to write (None if the log
+    # isn't updated).
+    max_log_records: Optional[int]
+
+
+class SnapshotChannel(Generic[T]):
+    """
+    A thread-safe, single-slot channel. Only the most recent item is kept,
+    items that were never taken are counted as dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize this instance."""
+
+        self._lock = Lock()
+        self._item: Optional[T] = None
+        self.dropped = 0
+
+    @property
+    def pending(self) -> bool:
+        """Determine if an item is waiting to be taken."""
+        return self._item is not None
+
+    def put(self, item: T) -> bool:
+        """
+        Send an item (replacing any that's pending). Returns whether or not
+        the receiver should be notified (no item was already pending).
+        """
+
+        with self._lock:
+            result = self._item is None
+            if not result:
+                self.dropped += 1
+            self._item = item
+
+        return result
+
+    def take(self) -> Optional[T]:
+        """Receive the pending item (if there is one)."""
+
+        with self._lock:
+            item = self._item
+            self._item = None
+
+        return item
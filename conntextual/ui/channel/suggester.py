@@ -12,20 +12,47 @@ from runtimepy.channel.environment.command.processor import (
 )
 from textual.suggester import Suggester
 
+# internal
+from conntextual.ui.channel.search import NameIndex
+
 
 class CommandSuggester(Suggester):
     """An input suggester for channel environment commands."""
 
     processor: ChannelCommandProcessor
+    index: Optional[NameIndex]
+
+    def commandable(self, name: str) -> bool:
+        """Determine if a channel (or field) is commandable."""
+
+        chan = self.processor.env.field_or_channel(name)
+        return chan is not None and chan.commandable
 
     async def get_suggestion(self, value: str) -> Optional[str]:
         """Get an input suggestion."""
-        return self.processor.get_suggestion(value)
+
+        if self.index is None:
+            return self.processor.get_suggestion(value)
+
+        result = None
+
+        # Complete channel names from the index (preferring commandable
+        # ones).
+        args = self.processor.parse(value)
+        if args is not None:
+            name = self.index.complete(args.channel, prefer=self.commandable)
+            if name is not None:
+                result = args.command + " " + name
+
+        return result
 
     @staticmethod
-    def create(processor: ChannelCommandProcessor) -> "CommandSuggester":
+    def create(
+        processor: ChannelCommandProcessor, index: NameIndex = None
+    ) -> "CommandSuggester":
         """A method for creating a command suggester."""
 
         result = CommandSuggester()
         result.processor = processor
+        result.index = index
         return result
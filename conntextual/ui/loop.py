@@ -0,0 +1,101 @@
+"""
+A module implementing event-loop instrumentation.
+"""
+
+# built-in
+import asyncio
+from dataclasses import dataclass
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.net.arbiter import AppInfo
+from runtimepy.net.arbiter.task import ArbiterTask, TaskFactory
+from runtimepy.primitives import Double, Uint32
+
+# internal
+from conntextual.ui.channel.metrics import StageTiming
+
+# The default for asyncio's own slow-callback threshold (in debug mode).
+DEFAULT_SLOW_CALLBACK_MS = 100.0
+
+
+@dataclass
+class LoopMetrics:
+    """Event-loop metrics."""
+
+    scheduling_lag: StageTiming
+    pending_tasks: Uint32
+    slow_callbacks: Uint32
+    slow_callback_ms: Double
+
+    @staticmethod
+    def create() -> "LoopMetrics":
+        """Create an event-loop metrics instance."""
+
+        result = LoopMetrics(
+            StageTiming.create(), Uint32(), Uint32(), Double()
+        )
+        result.slow_callback_ms.value = DEFAULT_SLOW_CALLBACK_MS
+        return result
+
+    def register(self, env: ChannelEnvironment) -> None:
+        """Register channels for these metrics."""
+
+        self.scheduling_lag.register(env, "scheduling_lag")
+        env.channel("pending_tasks", self.pending_tasks)
+        env.channel("slow_callbacks", self.slow_callbacks)
+        env.channel(
+            "slow_callback_ms", self.slow_callback_ms, commandable=True
+        )
+
+    def update(self, lag_ms: float, pending_tasks: int) -> None:
+        """Update these metrics with a new measurement."""
+
+        self.scheduling_lag.update(lag_ms)
+        self.pending_tasks.value = pending_tasks
+
+        # Scheduling lag this long means that something (e.g. a callback or
+        # task step) blocked the event loop.
+        if lag_ms > self.slow_callback_ms.value:
+            self.slow_callbacks.increment()
+
+
+class LoopMonitorTask(ArbiterTask):
+    """
+    A task that measures event-loop scheduling lag (how long a callback
+    that's ready to run waits to be run), the number of pending tasks and
+    the number of times the loop was blocked for longer than a threshold.
+    """
+
+    loop_metrics: LoopMetrics
+
+    def _init_state(self) -> None:
+        """Add channels to this instance's channel environment."""
+
+        self.loop_metrics = LoopMetrics.create()
+        self.loop_metrics.register(self.env)
+
+    async def init(self, app: AppInfo) -> None:
+        """Initialize this task with application information."""
+
+        await super().init(app)
+        self.env.finalize()
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await asyncio.sleep(0)
+        self.loop_metrics.update(
+            (loop.time() - start) * 1e3, len(asyncio.all_tasks(loop))
+        )
+
+        return True
+
+
+class LoopMonitor(TaskFactory[LoopMonitorTask]):
+    """A factory for the event-loop monitor task."""
+
+    kind = LoopMonitorTask
@@ -5,16 +5,18 @@ A module implementing a data model for base applications.
 # built-in
 import asyncio
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 # third-party
 from runtimepy.channel.environment import ChannelEnvironment
 from runtimepy.mixins.environment import ChannelEnvironmentMixin
 from runtimepy.net.arbiter import AppInfo
-from runtimepy.primitives import Bool, Double
+from runtimepy.primitives import Bool, Double, Uint32
 
 # internal
 from conntextual.ui.channel.environment import ChannelEnvironmentDisplay
+from conntextual.ui.channel.metrics import FrameMetrics
+from conntextual.ui.overview import FleetOverview
 
 
 @dataclass
@@ -27,10 +29,18 @@ class Model(ChannelEnvironmentMixin):
 
     uptime: Double
     paused: Bool
+    metrics: FrameMetrics
     start: float
 
+    # Snapshots that were replaced before being applied (if display updates
+    # are applied on another thread).
+    snapshots_dropped: Uint32
+
     tab_to_id: dict[str, str]
 
+    # Statistics of channels across environments (if enabled).
+    overview: Optional[FleetOverview] = None
+
     @staticmethod
     def create(app: AppInfo, env: ChannelEnvironment) -> "Model":
         """Create a model instance."""
@@ -42,9 +52,13 @@ class Model(ChannelEnvironmentMixin):
             [],
             Double(),
             Bool(),
+            FrameMetrics.create(),
             asyncio.get_running_loop().time(),
+            Uint32(),
             {},
         )
         result.env.channel("uptime", result.uptime)
+        result.env.channel("snapshots_dropped", result.snapshots_dropped)
+        result.metrics.register(result.env)
 
         return result
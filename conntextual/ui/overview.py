@@ -0,0 +1,190 @@
+"""
+A module implementing an overview of channels across channel environments
+(e.g. the same channel of many remote connections).
+"""
+
+# built-in
+import logging
+from typing import List, NamedTuple, cast
+
+# third-party
+import numpy as np
+from numpy.typing import NDArray
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.channel.environment.command.processor import (
+    ChannelCommandProcessor,
+)
+from runtimepy.primitives import AnyPrimitive, Double, Uint32
+
+# internal
+from conntextual.ui.channel.pattern import PatternPair
+
+# Values that differ from the mean by more than this many standard
+# deviations are counted as outliers.
+DEFAULT_OUTLIER_THRESHOLD = 3.0
+
+
+class ChannelStatistics(NamedTuple):
+    """Channels for a single channel's statistics (across environments)."""
+
+    count: Uint32
+    minimum: Double
+    maximum: Double
+    mean: Double
+    std: Double
+    outliers: Uint32
+
+    # The (one-based) tab number of the environment whose value differs the
+    # most from the mean (0 if there's no such environment).
+    worst_tab: Uint32
+
+    @staticmethod
+    def create(env: ChannelEnvironment, name: str) -> "ChannelStatistics":
+        """Create channels for a channel's statistics."""
+
+        result = ChannelStatistics(
+            Uint32(),
+            Double(),
+            Double(),
+            Double(),
+            Double(),
+            Uint32(),
+            Uint32(),
+        )
+
+        with env.names_pushed(name):
+            for field, primitive in zip(result._fields, result.primitives):
+                env.channel(field, primitive)
+
+        return result
+
+    @property
+    def primitives(self) -> List[AnyPrimitive]:
+        """Get this instance's primitives (in field order)."""
+        return cast(List[AnyPrimitive], list(self))
+
+
+class ChannelMatrix:
+    """
+    Values of the channels that match a pattern, gathered across
+    environments into a matrix (one row per environment and one column per
+    channel name).
+    """
+
+    def __init__(
+        self,
+        environments: List[tuple[int, ChannelEnvironment]],
+        pattern: PatternPair,
+    ) -> None:
+        """Initialize this instance."""
+
+        # Tab numbers (of each row).
+        self.tabs = np.array([tab for tab, _ in environments], dtype=np.int64)
+
+        columns: dict[str, int] = {}
+        positions: List[tuple[int, int]] = []
+        self.primitives: List[AnyPrimitive] = []
+
+        for row, (_, env) in enumerate(environments):
+            for name in env.names:
+                result = env.get(name)
+
+                # Statistics of enumeration values aren't meaningful.
+                if result is None or result[1] is not None:
+                    continue
+                if not pattern.matches(name):
+                    continue
+
+                column = columns.setdefault(name, len(columns))
+                positions.append((row, column))
+                self.primitives.append(result[0].raw)
+
+        self.names = list(columns)
+        self.matrix = np.full((len(environments), len(columns)), np.nan)
+
+        # Flat indices of each primitive's value.
+        self.positions = np.array(
+            [row * len(columns) + column for row, column in positions],
+            dtype=np.int64,
+        )
+
+    def update(self) -> NDArray[np.float64]:
+        """Gather current values (missing values are NaN)."""
+
+        self.matrix.flat[self.positions] = np.fromiter(
+            (x.value for x in self.primitives),
+            dtype=np.float64,
+            count=len(self.primitives),
+        )
+        return self.matrix
+
+
+class FleetOverview:
+    """Statistics of channels across environments, published as channels."""
+
+    def __init__(
+        self,
+        environments: List[tuple[int, ChannelEnvironment]],
+        pattern: PatternPair,
+        logger: logging.Logger,
+    ) -> None:
+        """Initialize this instance."""
+
+        self.values = ChannelMatrix(environments, pattern)
+
+        self.command = ChannelCommandProcessor(ChannelEnvironment(), logger)
+        env = self.command.env
+
+        self.outlier_threshold = Double()
+        self.outlier_threshold.value = DEFAULT_OUTLIER_THRESHOLD
+        env.channel(
+            "outlier_threshold", self.outlier_threshold, commandable=True
+        )
+
+        self.environments = Uint32()
+        self.environments.value = len(environments)
+        env.channel("environments", self.environments)
+
+        self.statistics = [
+            ChannelStatistics.create(env, name) for name in self.values.names
+        ]
+
+        env.finalize()
+
+    def update(self) -> None:
+        """Update statistics with current channel values."""
+
+        if not self.statistics:
+            return
+
+        matrix = self.values.update()
+        present = ~np.isnan(matrix)
+
+        # Columns always have at least one value.
+        mean = np.nanmean(matrix, axis=0)
+        std = np.nanstd(matrix, axis=0)
+
+        # Deviations of missing values never count.
+        deviation = np.where(present, np.abs(matrix - mean), -1.0)
+        varies = std > 0.0
+
+        # Statistics in field order (one column per channel name).
+        columns = [
+            present.sum(axis=0),
+            np.nanmin(matrix, axis=0),
+            np.nanmax(matrix, axis=0),
+            mean,
+            std,
+            ((deviation > self.outlier_threshold.value * std) & varies).sum(
+                axis=0
+            ),
+            np.where(
+                varies, self.values.tabs[np.argmax(deviation, axis=0)], 0
+            ),
+        ]
+
+        for stats, values in zip(
+            self.statistics, zip(*(x.tolist() for x in columns))
+        ):
+            for primitive, value in zip(stats.primitives, values):
+                primitive.value = value
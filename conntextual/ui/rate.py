@@ -0,0 +1,63 @@
+"""
+A module implementing an adaptive frame-rate controller.
+"""
+
+# built-in
+from dataclasses import dataclass
+
+DEFAULT_PERIOD_S = 0.1
+DEFAULT_MIN_PERIOD_S = 0.02
+DEFAULT_MAX_PERIOD_S = 1.0
+DEFAULT_CPU_BUDGET = 0.25
+
+# Factors applied to the frame period when speeding up or backing off.
+SPEED_UP = 0.5
+BACK_OFF = 1.25
+
+# The fraction of the difference from the configured period that's removed
+# each frame (while frames change things).
+SETTLE = 0.5
+
+
+@dataclass
+class FrameRateController:
+    """
+    A controller for a frame period. The period shortens when plotted
+    channels update faster than frames are drawn, lengthens when frames
+    don't change anything, otherwise settles back to the configured period
+    and never goes below what a dispatch cost allows within a CPU budget (a
+    fraction of a core's time).
+    """
+
+    period_s: float = DEFAULT_PERIOD_S
+    min_period_s: float = DEFAULT_MIN_PERIOD_S
+    max_period_s: float = DEFAULT_MAX_PERIOD_S
+    cpu_budget: float = DEFAULT_CPU_BUDGET
+
+    def update(
+        self, period_s: float, cost_s: float, changes: int, samples: int
+    ) -> float:
+        """
+        Get the next frame period based on the current one, the cost of the
+        most recent frame, the number of display elements it changed and the
+        number of plot samples it drew.
+        """
+
+        result = period_s
+
+        # More than one new sample per frame means that frames aren't keeping
+        # up with plotted channels.
+        if samples > 1:
+            result *= SPEED_UP
+        elif not changes and not samples:
+            result *= BACK_OFF
+        else:
+            result += SETTLE * (self.period_s - result)
+
+        result = min(max(result, self.min_period_s), self.max_period_s)
+
+        # The CPU budget takes precedence over the configured bounds.
+        if self.cpu_budget > 0.0:
+            result = max(result, cost_s / self.cpu_budget)
+
+        return result
@@ -0,0 +1,123 @@
+"""
+A module implementing synthetic channel environments (e.g. for benchmarking).
+"""
+
+# built-in
+from random import randint, random
+from typing import List
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.net.arbiter import AppInfo
+from runtimepy.net.arbiter.task import ArbiterTask, TaskFactory
+from runtimepy.primitives import AnyPrimitive, Uint8
+from runtimepy.primitives.field import BitField, BitFlag
+
+DEFAULT_CHANNELS = 1000
+
+# The fraction of channels updated by each dispatch.
+DEFAULT_UPDATE_FRACTION = 0.1
+
+ENUM = "SyntheticEnum"
+ENUM_SIZE = 8
+
+# The number of table rows added by each group of synthetic channels (bit
+# fields make up a large fraction of rows, as environments can only hold
+# 2^16 channels).
+GROUP_ROWS = 9
+
+
+def synthetic_env(
+    env: ChannelEnvironment, channels: int = DEFAULT_CHANNELS
+) -> List[AnyPrimitive]:
+    """
+    Add (approximately) a number of channels (of mixed kinds, bit fields are
+    counted as channels) to an environment. Returns the underlying primitives
+    (in the order they should be updated).
+    """
+
+    env.enum(ENUM, "int", items={f"value_{x}": x for x in range(ENUM_SIZE)})
+
+    primitives: List[AnyPrimitive] = []
+
+    for idx in range(-(-channels // GROUP_ROWS)):
+        with env.names_pushed(str(idx)):
+            env.float_channel("float", "double")
+            env.int_channel("int", "int32")
+            env.bool_channel("bool")
+            env.int_channel("enum", enum=ENUM)
+
+            raw = Uint8()
+            env.int_channel("raw", raw)
+            env.add_field(BitField(f"{idx}.field", raw, 0, 4))
+            for bit in range(4, 7):
+                env.add_field(BitFlag(f"{idx}.flag{bit}", raw, bit))
+
+            primitives.extend(
+                env[f"{idx}.{name}"][0].raw
+                for name in ["float", "int", "bool", "enum"]
+            )
+            primitives.append(raw)
+
+    return primitives
+
+
+def update_primitive(primitive: AnyPrimitive) -> None:
+    """Update a primitive with a new (arbitrary) value."""
+
+    kind = primitive.kind
+
+    if kind.is_float:
+        primitive.value = random()
+    elif kind.is_boolean:
+        primitive.value = not primitive.value
+    else:
+        primitive.value = randint(0, ENUM_SIZE - 1)
+
+
+class SyntheticTask(ArbiterTask):
+    """
+    A task with a synthetic channel environment. Environment sizes are set
+    (per task name) by the 'synthetic_channels' app config.
+    """
+
+    primitives: List[AnyPrimitive]
+    offset: int
+
+    async def init(self, app: AppInfo) -> None:
+        """Initialize this task with application information."""
+
+        await super().init(app)
+
+        sizes: dict[str, int] = app.config.get(
+            "synthetic_channels", {}
+        )  # type: ignore
+        self.primitives = synthetic_env(
+            self.env, sizes.get(self.name, DEFAULT_CHANNELS)
+        )
+        self.offset = 0
+
+        self.env.finalize()
+
+    def update(self, fraction: float = DEFAULT_UPDATE_FRACTION) -> None:
+        """Update a fraction of this task's channels."""
+
+        primitives = self.primitives
+        count = len(primitives)
+
+        for idx in range(int(count * fraction)):
+            update_primitive(primitives[(self.offset + idx) % count])
+
+        self.offset = (self.offset + int(count * fraction)) % count
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        self.update()
+        return True
+
+
+class Synthetic(TaskFactory[SyntheticTask]):
+    """A factory for synthetic-environment tasks."""
+
+    kind = SyntheticTask
@@ -4,6 +4,11 @@ A module implementing a TUI application task.
 
 # built-in
 import asyncio
+from contextlib import suppress
+from functools import partial
+from threading import Event, Thread
+from time import perf_counter
+from typing import Optional
 
 # third-party
 import psutil
@@ -11,31 +16,64 @@ from runtimepy.net.arbiter import AppInfo
 from runtimepy.net.arbiter.task import ArbiterTask, TaskFactory
 
 # internal
+from conntextual.arbiter import MainThread
 from conntextual.ui.base import Base
+from conntextual.ui.channel.snapshot import FrameOptions
+from conntextual.ui.loop import LoopMonitorTask
+from conntextual.ui.rate import (
+    DEFAULT_CPU_BUDGET,
+    DEFAULT_MAX_PERIOD_S,
+    DEFAULT_MIN_PERIOD_S,
+    FrameRateController,
+)
 
 DEFAULT_MAX_SAMPLES = 64
+DEFAULT_MAX_LOG_RECORDS = 100
+DEFAULT_HOUSEKEEPING_PERIOD_S = 1.0
+MIN_HOUSEKEEPING_PERIOD_S = 0.1
+MIB = 1024**2
 
 
 class TuiDispatchTask(ArbiterTask):
     """A class implementing a periodic task for a textual TUI."""
 
     tui: Base
-    tui_task: asyncio.Task[None]
+    tui_task: Optional[asyncio.Task[None]]
+
+    # Set when the application stops (if it runs in its own thread).
+    tui_stopped: Optional[Event]
+    housekeeping_task: asyncio.Task[None]
     process: psutil.Process
+    rate: FrameRateController
 
-    def _add_housekeeping_metrics(self) -> None:
+    def _add_housekeeping_metrics(self, app: AppInfo) -> None:
         """Initialize housekeeping metrics."""
 
         self.env.float_channel("memory_percent")
         self.env.float_channel("cpu_percent")
+        self.env.float_channel("rss_mib")
+        self.env.int_channel("threads")
+        self.env.int_channel("open_fds")
+
+        self.env.float_channel("housekeeping_period_s", commandable=True)
+        self.env.set(
+            "housekeeping_period_s",
+            app.config.get(
+                "housekeeping_period_s", DEFAULT_HOUSEKEEPING_PERIOD_S
+            ),  # type: ignore
+        )
 
         self.env.bool_channel("update_table", commandable=True)
         self.env.bool_channel("update_log", commandable=True)
         self.env.bool_channel("update_plot", commandable=True)
+        self.env.bool_channel("update_visible_only", commandable=True)
 
         self.env.int_channel("max_plot_samples", commandable=True)
 
+        self.env.int_channel("max_log_records", commandable=True)
+
         self.env.set("max_plot_samples", DEFAULT_MAX_SAMPLES)
+        self.env.set("max_log_records", DEFAULT_MAX_LOG_RECORDS)
 
         self.env.set("update_table", True)
         self.env.set("update_log", True)
@@ -43,52 +81,207 @@ class TuiDispatchTask(ArbiterTask):
 
         self.process = psutil.Process()
 
+    def _add_rate_controls(self, app: AppInfo) -> None:
+        """Initialize adaptive frame-rate channels."""
+
+        self.env.bool_channel("adaptive_rate", commandable=True)
+        self.env.float_channel("min_period_s", commandable=True)
+        self.env.float_channel("max_period_s", commandable=True)
+        self.env.float_channel("cpu_budget", commandable=True)
+        self.env.float_channel("frame_rate_hz")
+
+        for name, default in [
+            ("adaptive_rate", False),
+            ("min_period_s", DEFAULT_MIN_PERIOD_S),
+            ("max_period_s", DEFAULT_MAX_PERIOD_S),
+            ("cpu_budget", DEFAULT_CPU_BUDGET),
+        ]:
+            self.env.set(name, app.config.get(name, default))  # type: ignore
+
+        # Periods settle back to this task's configured period.
+        self.rate = FrameRateController(period_s=self.period_s.value)
+
+    def adapt_rate(self, cost_s: float) -> None:
+        """
+        Update this task's period (if adaptive rate is enabled) based on the
+        cost of, and changes made by, the most recent dispatch.
+        """
+
+        if self.env.value("adaptive_rate"):
+            rate = self.rate
+            rate.min_period_s = self.env.value("min_period_s")  # type: ignore
+            rate.max_period_s = self.env.value("max_period_s")  # type: ignore
+            rate.cpu_budget = self.env.value("cpu_budget")  # type: ignore
+
+            changes = 0
+            samples = 0
+
+            if not self.tui.model.paused:
+                changes = int(self.env.value("cells_updated")) + int(
+                    self.env.value("log_records")
+                )
+                samples = int(self.env.value("plot_samples"))
+
+            self.set_period(
+                rate.update(self.period_s.value, cost_s, changes, samples),
+                update_default=False,
+            )
+
+        self.env.set("frame_rate_hz", 1.0 / self.period_s.value)
+
     def poll_housekeeping(self) -> None:
         """Update housekeeping metrics."""
 
         self.env.set("memory_percent", psutil.virtual_memory().percent)
 
-        with self.process.oneshot():
-            self.env.set("cpu_percent", self.process.cpu_percent())
+        process = self.process
+        with process.oneshot():
+            self.env.set("cpu_percent", process.cpu_percent())
+            self.env.set("rss_mib", process.memory_info().rss / MIB)
+            self.env.set("threads", process.num_threads())
+
+            # Not available on all platforms.
+            if hasattr(process, "num_fds"):
+                self.env.set("open_fds", process.num_fds())
+
+    async def housekeeping(self) -> None:
+        """Poll housekeeping metrics (at their own rate)."""
+
+        metrics = self.tui.model.metrics
+
+        while True:
+            # The period is commandable (don't poll continuously if it's
+            # set to zero or less).
+            period_s: float = self.env.value(
+                "housekeeping_period_s"
+            )  # type: ignore
+            await asyncio.sleep(max(period_s, MIN_HOUSEKEEPING_PERIOD_S))
+
+            # Keep polling if metrics can't be read (e.g. the process
+            # information isn't accessible).
+            try:
+                with metrics.housekeeping.measure():
+                    self.poll_housekeeping()
+            except (psutil.Error, OSError):
+                self.logger.exception("Couldn't poll housekeeping metrics.")
+
+    def _run_tui(self, headless: bool) -> None:
+        """
+        Run the application (on its own thread, or on the main thread while
+        the rest of the application runs in its own thread).
+        """
+
+        assert self.tui_stopped is not None
+
+        try:
+            asyncio.run(self.tui.run_async(headless=headless))
+        finally:
+            self.tui_stopped.set()
+            self.tui.arbiter_loop.call_soon_threadsafe(
+                self.tui.model.app.stop.set
+            )
 
     async def init(self, app: AppInfo) -> None:
         """Initialize this task with application information."""
 
         await super().init(app)
-        self.tui = Base.create(app, self.env)
 
-        self._add_housekeeping_metrics()
+        headless: bool = app.config.get("headless", False)  # type: ignore
+
+        # Terminal drivers install signal handlers, which is only possible
+        # from the main thread (interactive applications run on the main
+        # thread, if the rest of the application runs in its own thread).
+        main_thread = MainThread.active
+        threaded = bool(app.config.get("ui_thread", False))
+        if threaded and not headless and main_thread is None:
+            self.logger.warning(
+                "Interactive applications only run in their own thread if "
+                "the rest of the application does too."
+            )
+            threaded = False
+
+        self.tui = Base.create(app, self.env, threaded=threaded)
+
+        self._add_housekeeping_metrics(app)
+        self._add_rate_controls(app)
+
+        # Also publish event-loop metrics in this environment.
+        for monitor in app.search_tasks(kind=LoopMonitorTask):
+            with self.env.names_pushed(monitor.name):
+                monitor.loop_metrics.register(self.env)
+
         self.env.finalize()
 
-        # Create application task.
-        self.tui_task = asyncio.create_task(
-            self.tui.run_async(
-                headless=app.config.get("headless", False),  # type: ignore
+        # Create application task (or thread).
+        self.tui_task = None
+        self.tui_stopped = None
+        if threaded:
+            self.tui_stopped = Event()
+            run_tui = partial(self._run_tui, headless)
+            if headless:
+                Thread(target=run_tui, name=self.name, daemon=True).start()
+            else:
+                assert main_thread is not None
+                main_thread.submit(run_tui)
+        else:
+            self.tui_task = asyncio.create_task(
+                self.tui.run_async(headless=headless)
             )
-        )
 
         # Wait for the application to be composed.
         await self.tui.composed.wait()
 
+        self.poll_housekeeping()
+        self.housekeeping_task = asyncio.create_task(self.housekeeping())
+
     async def dispatch(self) -> bool:
         """Dispatch an iteration of this task."""
 
-        self.poll_housekeeping()
-        self.tui.dispatch(
-            self.env.value("max_plot_samples"),  # type: ignore
-            update_table=self.env.value("update_table"),  # type: ignore
-            update_log=self.env.value("update_log"),  # type: ignore
-            update_plot=self.env.value("update_plot"),  # type: ignore
+        start = perf_counter()
+
+        # Display updates are applied by the application's own thread, if it
+        # has one.
+        (self.tui.capture if self.tui.threaded else self.tui.dispatch)(
+            FrameOptions(
+                self.env.value("max_plot_samples"),  # type: ignore
+                self.env.value("max_log_records"),  # type: ignore
+                update_table=self.env.value("update_table"),  # type: ignore
+                update_log=self.env.value("update_log"),  # type: ignore
+                update_plot=self.env.value("update_plot"),  # type: ignore
+                visible_only=self.env.value(
+                    "update_visible_only"
+                ),  # type: ignore
+            )
         )
 
+        cost_s = perf_counter() - start
+
+        # Include the cost of applying the most recent display update on the
+        # application's own thread.
+        if self.tui.threaded:
+            cost_s += self.tui.model.metrics.dispatch.last.value / 1e3
+
+        self.adapt_rate(cost_s)
+
         return True
 
     async def stop_extra(self) -> None:
         """Extra actions to perform when this task is stopping."""
 
-        # Ensure that the app task is awaited.
-        await self.tui.action_quit()
-        await self.tui_task
+        self.housekeeping_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.housekeeping_task
+
+        # Ensure that the app task (or thread) is awaited.
+        if self.tui_stopped is not None:
+            if not self.tui_stopped.is_set():
+                with suppress(RuntimeError):
+                    self.tui.schedule(self.tui.exit)
+            await asyncio.to_thread(self.tui_stopped.wait)
+
+        if self.tui_task is not None:
+            await self.tui.action_quit()
+            await self.tui_task
 
 
 class TuiDispatch(TaskFactory[TuiDispatchTask]):
@@ -2,7 +2,20 @@
 A module containing miscellaneous.
 """
 
+# built-in
+import re
+
+# Characters that aren't valid in identifier values.
+INVALID_ID_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 def css_name(name: str) -> str:
-    """Replace some characters that don't work in identifier values."""
-    return name.replace(".", "_")
+    """
+    Replace characters that don't work in identifier values (identifiers
+    also can't start with a digit).
+    """
+
+    result = INVALID_ID_CHARS.sub("_", name)
+    if not result or result[0].isdigit():
+        result = "_" + result
+    return result
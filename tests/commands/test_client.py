@@ -3,14 +3,73 @@ Test the 'commands.client' module.
 """
 
 # built-in
+from argparse import ArgumentParser
 from subprocess import run
 from sys import executable
 
+# third-party
+from runtimepy.net.arbiter import AppInfo
+from vcorelib.dict import merge
+
 # module under test
 from conntextual import PKG_NAME
+from conntextual.arbiter import run as run_app
+from conntextual.client import client_args, client_config
+from conntextual.ui.channel.model import ChannelEnvironmentSource
+from conntextual.ui.task import TuiDispatchTask
+
+# internal
+from tests.test_arbiter import servers
 
 
 def test_client_command_basic():
     """Test basic argument parsing."""
 
     run([executable, "-m", PKG_NAME, "client", "localhost", "0"], check=False)
+
+
+async def check_remote(app: AppInfo) -> int:
+    """Verify that each endpoint's connection has a remote-connection tab."""
+
+    task = next(iter(app.search_tasks(kind=TuiDispatchTask)))
+    await task.tui.composed.wait()
+
+    port = app.config["port"]
+    assert sorted(
+        env.model.name
+        for env in task.tui.model.environments
+        if env.model.source == ChannelEnvironmentSource.CONNECTION_REMOTE
+    ) == [f"127.0.0.1:{port}", f"localhost:{port}"]
+    return 0
+
+
+def test_client_ui_multiple_endpoints():
+    """Test the user interface with connections to multiple endpoints."""
+
+    data = servers()
+    port = str(data["port_overrides"]["tcp_json"])
+
+    parser = ArgumentParser()
+    client_args(parser)
+    merge(
+        data,
+        client_config(
+            parser.parse_args(
+                ["-e", f"localhost:{port}", "-e", f"127.0.0.1:{port}"]
+            )
+        ),
+    )
+    data["app"] = ["tests.commands.test_client.check_remote"]
+    data["config"]["port"] = port
+
+    assert (
+        run_app(
+            [
+                "package://conntextual/app.yaml",
+                "package://tests/valid/textual_ui_test.yaml",
+            ],
+            data=data,
+            uvloop=False,
+        )
+        == 0
+    )
@@ -40,3 +40,16 @@ def test_ui_command_basic():
 
     args = [PKG_NAME, "-v", "ui", "--init_only", test_input]
     assert conntextual_main(args) == 0
+
+    # Other runtimepy commands are run via runtimepy's entry-point.
+    assert conntextual_main([PKG_NAME, "ui", "--cmd", "noop"]) != 0
+
+
+def test_ui_benchmark():
+    """Test the user-interface benchmark."""
+
+    args = [PKG_NAME, "--no-uvloop", "ui", "--variant", "headless"]
+    for config in ["benchmark_test.yaml", "benchmark_thread_test.yaml"]:
+        assert (
+            conntextual_main(args + [f"package://tests/valid/{config}"]) == 0
+        )
@@ -0,0 +1,140 @@
+"""
+conntextual - Test the 'arbiter' module.
+"""
+
+# built-in
+from argparse import Namespace
+import asyncio
+from threading import current_thread, main_thread
+from typing import Any
+
+# third-party
+from runtimepy.net import IPv4Host, get_free_socket_name
+from runtimepy.net.arbiter import AppInfo
+
+# module under test
+from conntextual.arbiter import MainThread, run
+from conntextual.server import server_config
+
+
+def build_config(data: dict[str, Any]) -> None:
+    """A configuration builder that records which servers it sees."""
+
+    data["config"]["built"] = sorted(x["factory"] for x in data["servers"])
+
+
+async def check_config(app: AppInfo) -> int:
+    """Verify that in-memory configuration data was loaded."""
+
+    assert app.config["from_data"] is True
+
+    # Configuration builders see in-memory configuration data.
+    assert app.config["built"]
+    return 0
+
+
+def servers() -> dict[str, Any]:
+    """Get a (TCP and WebSocket) JSON server configuration."""
+
+    return server_config(
+        Namespace(
+            tcp=0,
+            tcp_factory="tcp_json",
+            websocket=0,
+            websocket_factory="websocket_json",
+            init_only=True,
+        )
+    )
+
+
+async def check_connections(app: AppInfo) -> int:
+    """Verify that only reachable deferred connections were opened."""
+
+    assert {"first", "second"} <= set(app.connections)
+    assert "unreachable" not in app.connections
+    return 0
+
+
+def test_run_basic():
+    """Test running an application from in-memory configuration data."""
+
+    data = {
+        "app": ["tests.test_arbiter.check_config"],
+        "config_builders": ["tests.test_arbiter.build_config"],
+        "config": {"from_data": True},
+        **servers(),
+    }
+
+    assert run([], data=data, init_only=True, uvloop=False) == 0
+
+    # The caller's data isn't modified.
+    assert data["config"] == {"from_data": True}
+
+
+def test_run_connect_limit():
+    """Test opening deferred connections with a connection limit."""
+
+    # Nothing listens on this port.
+    unreachable = get_free_socket_name(IPv4Host()).port
+
+    data = servers()
+    data["app"] = ["tests.test_arbiter.check_connections"]
+    data["config"] = {"connect_limit": 1}
+    data["clients"] = [
+        {
+            "name": name,
+            "factory": "tcp_json",
+            "defer": True,
+            "kwargs": {"host": "localhost", "port": "$tcp_json"},
+        }
+        for name in ["first", "second"]
+    ] + [
+        {
+            "name": "unreachable",
+            "factory": "websocket_json",
+            "defer": True,
+            "args": [f"ws://localhost:{unreachable}"],
+        }
+    ]
+
+    assert run([], data=data, uvloop=False) == 0
+
+
+async def check_main_thread(app: AppInfo) -> int:
+    """Verify that methods can be run on the main thread."""
+
+    assert current_thread() is not main_thread()
+
+    main = MainThread.active
+    assert main is not None
+
+    loop = asyncio.get_running_loop()
+    ran = asyncio.Event()
+
+    def method() -> None:
+        """A method to run on the main thread."""
+
+        assert current_thread() is main_thread()
+        loop.call_soon_threadsafe(ran.set)
+
+    main.submit(method)
+    await ran.wait()
+    app.logger.info("Ran a method on the main thread.")
+
+    return 0
+
+
+def test_run_main_thread():
+    """
+    Test running an application in its own thread (for an interactive user
+    interface that runs on the main thread).
+    """
+
+    data = {
+        "app": ["tests.test_arbiter.check_main_thread"],
+        "config": {"ui_thread": True},
+        **servers(),
+    }
+
+    assert run([], data=data, uvloop=False) == 0
+    assert MainThread.active is None
@@ -0,0 +1,109 @@
+"""
+conntextual - Test the 'client' module.
+"""
+
+# built-in
+from argparse import ArgumentParser
+
+# third-party
+from pytest import raises
+
+# module under test
+from conntextual.client import (
+    Endpoint,
+    client_args,
+    client_config,
+    connection_names,
+)
+
+# internal
+from tests.resources import resource
+
+
+def parse(*args: str):
+    """Parse client command-line arguments."""
+
+    parser = ArgumentParser()
+    client_args(parser)
+    return parser.parse_args(args)
+
+
+def test_endpoint_decode():
+    """Test decoding endpoints."""
+
+    assert Endpoint.decode("localhost:8000") == Endpoint("localhost", 8000)
+    assert Endpoint.decode(" ::1:8000\n") == Endpoint("::1", 8000)
+    assert Endpoint("localhost", 8000).name == "localhost:8000"
+
+    for value in ["localhost", ":8000", "localhost:", "localhost:port"]:
+        with raises(ValueError):
+            Endpoint.decode(value)
+
+    # Invalid command-line endpoints are argument errors.
+    with raises(SystemExit):
+        parse("-e", "localhost")
+
+
+def test_client_config_single():
+    """Test a single-endpoint client configuration."""
+
+    config = client_config(parse("localhost", "8000"))
+
+    assert config["clients"] == [
+        {
+            "name": "client",
+            "factory": "tcp_json",
+            "defer": False,
+            "kwargs": {"host": "localhost", "port": 8000},
+        }
+    ]
+    assert config["config"]["remote_connections"] == ["client"]
+
+    with raises(ValueError):
+        client_config(parse())
+    with raises(ValueError):
+        client_config(parse("localhost"))
+
+
+def test_client_config_multiple():
+    """Test a multiple-endpoint client configuration."""
+
+    config = client_config(
+        parse(
+            "localhost",
+            "8000",
+            "-e",
+            "localhost:8001",
+            "--endpoints",
+            str(resource("endpoints.txt")),
+            "--connect-limit",
+            "2",
+        )
+    )
+
+    names = [
+        "localhost:8000",
+        "localhost:8001",
+        "localhost:8002",
+        "127.0.0.1:8003",
+    ]
+
+    assert [x["name"] for x in config["clients"]] == names
+    assert all(x["defer"] for x in config["clients"])
+    assert config["config"] == {
+        "connect_limit": 2,
+        "remote_connections": names,
+    }
+
+
+def test_connection_names():
+    """Test that connection names have distinct identifier values."""
+
+    assert connection_names(
+        [
+            Endpoint("a.b", 1),
+            Endpoint("a_b", 1),
+            Endpoint("a-b", 1),
+            Endpoint("a?b", 1),
+        ]
+    ) == ["a.b:1", "a_b:1-2", "a-b:1", "a?b:1-3"]
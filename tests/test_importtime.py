@@ -0,0 +1,26 @@
+"""
+conntextual - Test the 'importtime' module.
+"""
+
+# module under test
+from conntextual.importtime import import_time
+
+# Modules that are imported by all application variants (and commands).
+LIGHTWEIGHT = [
+    "conntextual.entry",
+    "conntextual.client",
+    "conntextual.curses",
+    "conntextual.server",
+    "conntextual.ui",
+]
+
+
+def test_import_time_regression():
+    """Test that heavy modules are only loaded when they're needed."""
+
+    for module in LIGHTWEIGHT:
+        result = import_time(module)
+        assert result.seconds > 0.0
+        assert not result.heavy, result
+
+    assert "textual" in import_time("conntextual.ui.base").heavy
@@ -0,0 +1,24 @@
+"""
+conntextual - Test the 'util' module.
+"""
+
+# third-party
+from textual.dom import check_identifiers
+
+# module under test
+from conntextual.util import css_name
+
+
+def test_css_name_basic():
+    """Test that names are converted to valid identifiers."""
+
+    for name, expected in [
+        ("tui", "tui"),
+        ("a.b-c", "a_b-c"),
+        ("localhost:8000", "localhost_8000"),
+        ("127.0.0.1:8003", "_127_0_0_1_8003"),
+        ("", "_"),
+    ]:
+        result = css_name(name)
+        assert result == expected
+        check_identifiers("id", result)
@@ -0,0 +1,68 @@
+"""
+Test the 'ui.channel.buffer' module.
+"""
+
+# third-party
+import numpy as np
+from runtimepy.primitives import Bool, Float, Uint16, Uint64
+
+# module under test
+from conntextual.ui.channel.buffer import SampleBuffer, sample_dtype
+
+
+def test_sample_dtype_basic():
+    """Test sample data types for different primitives."""
+
+    assert sample_dtype(Float()) == np.float64
+    assert sample_dtype(Bool()) == np.int64
+    assert sample_dtype(Uint16()) == np.int64
+    assert sample_dtype(Uint64()) == np.float64
+
+
+def test_sample_buffer_basic():
+    """Test basic sample-buffer interactions."""
+
+    buf = SampleBuffer(np.int32, capacity=4)
+    assert len(buf) == 0
+
+    for idx in range(10):
+        buf.append(float(idx), idx)
+
+        count = min(idx + 1, 4)
+        assert len(buf) == count
+        assert list(buf.values) == list(range(idx + 1 - count, idx + 1))
+        assert list(buf.timestamps) == list(buf.values)
+
+    # Views don't copy.
+    assert buf.values.base is not None
+
+    # Shrink.
+    buf.resize(2)
+    assert list(buf.values) == [8, 9]
+    buf.append(10.0, 10)
+    assert list(buf.values) == [9, 10]
+
+    # Grow (existing samples are retained).
+    buf.resize(8)
+    assert buf.capacity == 8
+    assert list(buf.values) == [9, 10]
+    for idx in range(11, 20):
+        buf.append(float(idx), idx)
+    assert list(buf.values) == list(range(12, 20))
+
+    buf.resize(0)
+    assert len(buf) == 0
+    buf.append(20.0, 20)
+    assert len(buf) == 0
+
+    buf.resize(4)
+    buf.append(21.0, 21)
+    assert list(buf.values) == [21]
+
+    generation = buf.generation
+    buf.resize(8)
+    assert buf.generation == generation
+
+    buf.clear()
+    assert len(buf) == 0
+    assert buf.generation == generation + 1
@@ -0,0 +1,41 @@
+"""
+Test the 'ui.channel.decimate' module.
+"""
+
+# third-party
+import numpy as np
+
+# module under test
+from conntextual.ui.channel.decimate import decimate, plot_columns
+
+
+def test_plot_columns_basic():
+    """Test plot-resolution calculations."""
+
+    assert plot_columns(10, "braille") == 20
+    assert plot_columns(10, "dot") == 10
+
+
+def test_decimate_basic():
+    """Test basic decimation scenarios."""
+
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000, dtype=np.int64)
+    y[123] = 10
+    y[456] = -10
+    y[999] = 5
+
+    # Small series aren't reduced.
+    assert len(decimate(x[:10], y[:10], 5)[1]) == 10
+    assert len(decimate(x, y, 0)[1]) == 1000
+
+    for columns in [7, 10, 33]:
+        new_x, new_y = decimate(x, y, columns)
+
+        assert len(new_y) <= 2 * (columns + 1)
+        assert np.all(np.diff(new_x) > 0)
+
+        # Spikes are preserved.
+        for idx in [123, 456, 999]:
+            assert idx in new_x
+            assert new_y[list(new_x).index(idx)] == y[idx]
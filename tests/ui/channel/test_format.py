@@ -0,0 +1,34 @@
+"""
+Test the 'ui.channel.format' module.
+"""
+
+# third-party
+from runtimepy.channel.environment.sample import poll_sample_env, sample_env
+
+# module under test
+from conntextual.ui.channel.format import (
+    channel_formatter,
+    field_formatter,
+    format_value,
+)
+
+
+def test_formatters_match_values():
+    """Test that per-row formatters match formatting environment values."""
+
+    env = sample_env()
+    env.finalize()
+    poll_sample_env(env)
+
+    for name in env.names:
+        chan_result = env.get(name)
+        if chan_result is not None:
+            value, formatter = channel_formatter(*chan_result)
+        else:
+            field = env.fields[name]
+            value, formatter = field_formatter(
+                field,
+                env.fields.enum_lookup.get(name) if field.is_enum else None,
+            )
+
+        assert formatter(value()) == format_value(env.value(name)), name
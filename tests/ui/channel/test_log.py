@@ -0,0 +1,63 @@
+"""
+Test the 'ui.channel.log' module.
+"""
+
+# built-in
+from logging import getLogger
+
+# module under test
+from conntextual.ui.channel.log import LogBuffer
+
+
+def test_log_buffer_basic():
+    """Test basic log-buffer interactions."""
+
+    logger = getLogger(__name__)
+    logger.propagate = False
+    logger.setLevel("INFO")
+
+    buffer = LogBuffer.create(logger, max_lines=4)
+    assert buffer.drain() == 0
+    assert len(buffer.lines) == 1
+
+    for idx in range(5):
+        logger.info("message %d", idx)
+
+    # The oldest lines are dropped.
+    assert buffer.drain() == 2
+    lines = list(buffer.lines)
+    assert len(lines) == 4
+    assert lines[0].endswith("message 1")
+
+    assert buffer.pop(3) == lines[:3]
+    assert buffer.pop(3) == lines[3:]
+    assert not buffer.pop(3)
+
+    # Records that don't fit in the buffer are dropped.
+    for idx in range(6):
+        logger.info("message %d", idx)
+    assert buffer.drain() == 2
+    lines = list(buffer.lines)
+    assert len(lines) == 4
+    assert lines[0].endswith("message 2")
+
+
+def test_log_buffer_restore():
+    """Test returning written lines to a log buffer."""
+
+    logger = getLogger(f"{__name__}.restore")
+    logger.propagate = False
+    logger.setLevel("INFO")
+
+    buffer = LogBuffer.create(logger, max_lines=4)
+    buffer.drain()
+    buffer.pop(1)
+
+    logger.info("pending")
+    buffer.drain()
+
+    # Restored lines precede pending ones (and the oldest are dropped).
+    buffer.restore(["a", "b", "c", "d"])
+    lines = list(buffer.lines)
+    assert lines[:3] == ["b", "c", "d"]
+    assert lines[3].endswith("pending")
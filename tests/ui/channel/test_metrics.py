@@ -0,0 +1,40 @@
+"""
+Test the 'ui.channel.metrics' module.
+"""
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+
+# module under test
+from conntextual.ui.channel.metrics import FrameMetrics, StageTiming
+
+
+def test_stage_timing_basic():
+    """Test stage-timing updates."""
+
+    timing = StageTiming.create()
+
+    timing.update(10.0)
+    timing.update(0.0)
+    assert timing.last.value == 0.0
+    assert timing.max.value == 10.0
+    assert 0.0 < timing.ewma.value < 10.0
+
+    with timing.measure():
+        pass
+    assert timing.max.value == 10.0
+    assert timing.last.value < 10.0
+
+
+def test_frame_metrics_register():
+    """Test that frame metrics are registered as channels."""
+
+    env = ChannelEnvironment()
+    metrics = FrameMetrics.create()
+    metrics.register(env)
+    env.finalize()
+
+    metrics.plot.update(2.5)
+    assert env.value("plot_time_ms") == 2.5
+    assert env.value("plot_time_max_ms") == 2.5
+    assert env.value("dispatch_time_ewma_ms") == 0.0
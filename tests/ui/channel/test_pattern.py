@@ -0,0 +1,98 @@
+"""
+Test the 'ui.channel.pattern' module.
+"""
+
+# built-in
+import re
+
+# module under test
+from conntextual.ui.channel.pattern import PatternPair, combine
+
+
+def test_combine_basic():
+    """Test scenarios for combining patterns."""
+
+    assert combine([re.compile("a"), re.compile("b")]) is not None
+
+    # Different flags.
+    assert combine([re.compile("a"), re.compile("b", re.I)]) is None
+
+    # Backreferences.
+    assert combine([re.compile(r"(a)\1"), re.compile("b")]) is None
+    assert combine([re.compile(r"(?P<x>a)(?P=x)"), re.compile("b")]) is None
+
+    # Conditional groups.
+    assert (
+        combine([re.compile("(x)y"), re.compile(r"^(a)?(?(1)b|c)$")]) is None
+    )
+
+    # Duplicate group names.
+    assert combine([re.compile("(?P<x>a)"), re.compile("(?P<x>b)")]) is None
+
+
+def test_pattern_pair_basic():
+    """Test basic pattern-pair matching."""
+
+    pair = PatternPair.from_dict({})
+    assert pair.matches("anything")
+
+    pair = PatternPair.from_dict(
+        {"include": ["metrics", "a"], "exclude": "tx"}
+    )
+    assert pair.include is not None
+    assert pair.exclude is not None
+
+    for _ in range(2):
+        assert pair.matches("metrics.rx")
+        assert pair.matches("b.a")
+        assert not pair.matches("metrics.tx")
+        assert not pair.matches("b")
+
+    # Patterns that can't be combined.
+    pair = PatternPair.from_dict(
+        {"include": ["(?P<x>a)", "(?P<x>b)"], "excludes": [r"(c)\1"]}
+    )
+    assert pair.include is None
+    assert pair.exclude is None
+
+    assert pair.matches("a")
+    assert pair.matches("b")
+    assert pair.matches("bc")
+    assert not pair.matches("bcc")
+    assert not pair.matches("d")
+
+    pair = PatternPair.from_dict({"include": ["(x)y", r"^(a)?(?(1)b|c)$"]})
+    assert pair.matches("ab")
+    assert pair.matches("c")
+    assert not pair.matches("ac")
+
+    # Patterns don't need to be combined.
+    pair = PatternPair([re.compile("a")], [re.compile("b")])
+    assert pair.matches("a")
+    assert not pair.matches("ab")
+
+
+def test_pattern_pair_strategies():
+    """Test that pattern-pair matching strategies agree."""
+
+    pair = PatternPair.from_dict(
+        {
+            "include": [f"^node{x}\\." for x in range(200)],
+            "exclude": [f"\\.tx{x}$" for x in range(200)],
+        }
+    )
+    assert pair.include is not None
+    assert pair.exclude is not None
+
+    # Without combined patterns, each pattern is searched individually.
+    individual = pair._replace(include=None, exclude=None)
+
+    names = [f"node{x % 300}.channel{x}.tx{x % 400}" for x in range(2000)]
+    expected = [individual.matches_uncached(x) for x in names]
+    assert any(expected) and not all(expected)
+
+    assert [pair.matches_uncached(x) for x in names] == expected
+
+    # Memoized results (computed, then cached).
+    for _ in range(2):
+        assert [pair.matches(x) for x in names] == expected
@@ -0,0 +1,69 @@
+"""
+Test the 'ui.channel.row' module.
+"""
+
+# third-party
+import numpy as np
+from rich.text import Text
+from runtimepy.primitives import Float
+from textual.coordinate import Coordinate
+
+# module under test
+from conntextual.ui.channel.format import format_value
+from conntextual.ui.channel.row import (
+    STALE_THRESHOLD_NS,
+    ChannelRow,
+    RowStates,
+)
+
+
+def test_row_states_basic():
+    """Test basic row change tracking."""
+
+    states = RowStates(3)
+    timestamps = np.array([1, 2, 3], dtype=np.int64)
+
+    now = 3
+
+    # The first poll always requires rendering.
+    changed, stale = states.poll(slice(None), timestamps, now)
+    assert list(changed) == [0, 1, 2]
+    assert not stale.any()
+    assert len(states.poll(slice(None), timestamps, now)[0]) == 0
+
+    # Updated rows require rendering (indices are relative to the window).
+    timestamps[2] = 4
+    now = 4
+    changed, _ = states.poll(slice(1, None), timestamps[1:], now)
+    assert list(changed) == [1]
+    assert len(states.poll(slice(None), timestamps, now)[0]) == 0
+
+    # Becoming stale requires rendering (only once).
+    now = 3 + STALE_THRESHOLD_NS + 1
+    changed, stale = states.poll(slice(None), timestamps, now)
+    assert list(changed) == [0, 1]
+    assert list(stale) == [True, True, False]
+    assert len(states.poll(slice(None), timestamps, now)[0]) == 0
+
+
+def test_channel_row_render():
+    """Test that rendered cells are cached."""
+
+    prim = Float()
+    row = ChannelRow.create(Coordinate(0, 2), "a", prim)
+
+    cell = row.render(row.value(), False)
+    assert cell == format_value(0.0)
+
+    # Updates that don't change the value don't require new cells.
+    prim.value = 0.0
+    assert row.render(row.value(), False) is None
+
+    prim.value = 1.0
+    assert row.render(row.value(), False) == format_value(1.0)
+
+    # Stale cells are styled.
+    cell = row.render(row.value(), True)
+    assert isinstance(cell, Text)
+    assert cell.plain == format_value(1.0)
+    assert row.render(row.value(), True) is None
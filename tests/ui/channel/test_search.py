@@ -0,0 +1,102 @@
+"""
+Test the 'ui.channel.search' module.
+"""
+
+# module under test
+from conntextual.ui.channel.search import (
+    MAX_MATCHES,
+    ChannelSearch,
+    NameIndex,
+)
+
+NAMES = [
+    "rx.kbps",
+    "tx.kbps",
+    "metrics.rx.message_rate",
+    "metrics.tx.message_rate",
+    "a.0.Random",
+    "a.0.random.max",
+]
+
+
+def test_name_index_search():
+    """Test searching a name index."""
+
+    index = NameIndex(NAMES)
+
+    # Names starting with the first term are first, then shorter ones.
+    assert [index.names[x] for x in index.search("rx")] == [
+        "rx.kbps",
+        "metrics.rx.message_rate",
+    ]
+
+    # Search is case-insensitive, every term has to match.
+    assert [index.names[x] for x in index.search("RANDOM a.0")] == [
+        "a.0.Random",
+        "a.0.random.max",
+    ]
+    assert [index.names[x] for x in index.search("message_rate tx")] == [
+        "metrics.tx.message_rate"
+    ]
+
+    # Long terms are verified (not only their substrings).
+    assert not index.search("kbps.rx")
+    assert not index.search("missing")
+    assert not index.search("  ")
+
+    # Postings are only built for substrings that were searched for.
+    assert "kbp" in index.postings
+    assert "mis" in index.postings
+    assert "max" not in index.postings
+
+    assert [index.names[x] for x in index.search("rate", limit=1)] == [
+        "metrics.rx.message_rate"
+    ]
+
+
+def test_name_index_complete():
+    """Test completing names from a prefix."""
+
+    index = NameIndex(NAMES)
+
+    assert index.complete("a.0") == "a.0.Random"
+    assert index.complete("a.0", prefer=lambda x: x.endswith("max")) == (
+        "a.0.random.max"
+    )
+    assert index.complete("metrics.") == "metrics.rx.message_rate"
+    assert index.complete("z") is None
+
+
+def test_channel_search_basic():
+    """Test incremental search of table rows."""
+
+    search = ChannelSearch.create(NAMES)
+
+    # The first name isn't in the table.
+    search.rows = {idx: idx - 1 for idx in range(1, len(NAMES))}
+
+    assert search.update("kbps") == 0
+    assert search.next() == 0
+
+    assert search.update("rate") == 1
+    assert search.next() == 2
+    assert search.next() == 1
+
+    assert search.update("missing") is None
+    assert search.next() is None
+
+    # Finding the same query again gets the next match.
+    assert search.find("rate") == 1
+    assert search.find("rate") == 2
+    assert search.find("kbps") == 0
+
+
+def test_channel_search_max_matches():
+    """Test that the number of matched rows is limited."""
+
+    names = [f"channel.{idx}" for idx in range(MAX_MATCHES * 2)]
+    search = ChannelSearch.create(names)
+    search.rows = {idx: idx for idx in range(len(names))}
+
+    assert search.update("chan") == 0
+    assert len(search.matches) == MAX_MATCHES
@@ -0,0 +1,147 @@
+"""
+Test the 'ui.channel.selected' module.
+"""
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+
+# module under test
+from conntextual.ui.channel.selected import (
+    MAX_SELECTED,
+    SelectedChannel,
+    SelectedChannels,
+)
+
+
+def test_selected_channel_sampling():
+    """Test that selected channels sample every value change."""
+
+    env = ChannelEnvironment()
+    env.int_channel("a")
+    env.finalize()
+
+    selected = SelectedChannel.create("a", env["a"])
+    channels = SelectedChannels([selected])
+
+    channels.poll(16)
+    assert len(selected.values) == 1
+
+    # Updates between polls aren't captured unless sampling is enabled.
+    env.set("a", 1)
+    env.set("a", 2)
+    channels.poll(16)
+    assert list(selected.values) == [0, 2]
+
+    selected.enable_sampling()
+    selected.enable_sampling()
+    for value in range(3, 10):
+        env.set("a", value)
+    assert list(selected.values) == [0] + list(range(2, 10))
+
+    selected.disable_sampling()
+    selected.disable_sampling()
+    env.set("a", 10)
+    assert len(selected.values) == 9
+
+    channels.poll(4)
+    assert list(selected.values) == [7, 8, 9, 10]
+
+    selected.reset()
+    assert len(selected.values) == 0
+
+
+def test_selected_channels_basic():
+    """Test basic interactions with a set of selected channels."""
+
+    env = ChannelEnvironment()
+    for idx in range(MAX_SELECTED + 1):
+        env.float_channel(str(idx))
+    env.finalize()
+
+    channels = [SelectedChannel.create(str(x), env[str(x)]) for x in range(3)]
+
+    selected = SelectedChannels([channels[0]])
+    assert selected.title == "0"
+
+    # The last channel can't be removed.
+    assert not selected.toggle(channels[0])
+
+    assert selected.toggle(channels[1])
+    assert selected.toggle(channels[2])
+    assert selected.title == "0, 1, 2"
+    assert selected.toggle(channels[1])
+    assert selected.title == "0, 2"
+
+    selected.reset()
+    assert channels[0].start_ns == channels[2].start_ns
+
+    selected.poll(4)
+    assert [len(x.y) for x in selected.series] == [1, 1]
+
+    # Sampling callbacks follow selection.
+    env.set("2", 1.0)
+    assert len(channels[2].values) == 2
+
+    selected.select(channels[1])
+    env.set("2", 2.0)
+    assert len(channels[2].values) == 2
+
+    # Channels are toggled by name (not by instance).
+    assert selected.find("1") is channels[1]
+    assert selected.find("2") is None
+    assert selected.toggle(SelectedChannel.create("2", env["2"]))
+    assert selected.toggle(SelectedChannel.create("1", env["1"]))
+    assert selected.title == "2"
+
+    # There's a limit to the number of selected channels.
+    for idx in range(MAX_SELECTED + 1):
+        selected.toggle(SelectedChannel.create(str(idx), env[str(idx)]))
+    assert len(selected.channels) == MAX_SELECTED
+
+
+def test_selected_channels_copy_series():
+    """Test copying plot-series data."""
+
+    env = ChannelEnvironment()
+    env.int_channel("a")
+    env.finalize()
+
+    channels = SelectedChannels([SelectedChannel.create("a", env["a"])])
+    channels.poll(16)
+
+    series = channels.copy_series([])
+    assert list(series[0].y) == [0]
+
+    # Copies are re-used until samples change.
+    assert channels.copy_series(series)[0] is series[0]
+
+    env.set("a", 1)
+    channels.poll(16)
+    copied = channels.copy_series(series)
+    assert copied[0] is not series[0]
+    assert list(copied[0].y) == [0, 1]
+    assert list(series[0].y) == [0]
+
+
+def test_selected_channels_poll():
+    """Test polling a set of selected channels."""
+
+    env = ChannelEnvironment()
+    for name in ["a", "b", "c"]:
+        env.int_channel(name)
+    env.finalize()
+
+    selected = SelectedChannels(
+        [SelectedChannel.create(x, env[x]) for x in ["a", "b", "c"]]
+    )
+    selected.reset()
+
+    assert selected.poll(16) == 3
+    assert selected.poll(16) == 0
+
+    # Updates that don't change values (so don't trigger sampling callbacks)
+    # are sampled by polling.
+    env.set("b", 0)
+    env.set("c", 1)
+    assert selected.poll(16) == 2
+    assert [list(x.y) for x in selected.series] == [[0], [0, 0], [0, 1]]
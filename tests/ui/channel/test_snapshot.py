@@ -0,0 +1,60 @@
+"""
+Test the 'ui.channel.snapshot' module.
+"""
+
+# third-party
+from runtimepy.primitives import Uint8
+from runtimepy.primitives.field import BitField
+from textual.coordinate import Coordinate
+
+# module under test
+from conntextual.ui.channel.row import ChannelRow
+from conntextual.ui.channel.snapshot import RowValues, SnapshotChannel
+
+
+def test_row_values_basic():
+    """Test capturing row values and timestamps."""
+
+    raw = Uint8()
+    field = BitField("field", raw, 4, 4)
+    rows = [
+        ChannelRow.create(Coordinate(0, 2), "a", Uint8()),
+        ChannelRow.create(Coordinate(1, 2), "b", raw),
+        ChannelRow.create(Coordinate(2, 2), "field", raw, field),
+    ]
+
+    values = RowValues(rows)
+
+    timestamps, captured = values.capture(slice(None))
+    assert list(timestamps) == [x.primitive.last_updated_ns for x in rows]
+    assert captured == [0, 0, 0]
+
+    # Only updated rows are read (values are copies).
+    raw.value = 0x21
+    timestamps, window = values.capture(slice(1, None))
+    assert list(timestamps) == [raw.last_updated_ns] * 2
+    assert window == [0x21, 2]
+    window[0] = None
+    assert values.capture(slice(None))[1] == [0, 0x21, 2]
+
+
+def test_snapshot_channel_basic():
+    """Test basic snapshot-channel interactions."""
+
+    channel: SnapshotChannel[int] = SnapshotChannel()
+    assert not channel.pending
+    assert channel.take() is None
+
+    # Only the first item sent (while none are pending) needs notification.
+    assert channel.put(1)
+    assert not channel.put(2)
+    assert channel.pending
+    assert channel.dropped == 1
+
+    # Only the most recent item is received.
+    assert channel.take() == 2
+    assert channel.take() is None
+
+    assert channel.put(3)
+    assert channel.take() == 3
+    assert channel.dropped == 1
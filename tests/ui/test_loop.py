@@ -0,0 +1,29 @@
+"""
+Test the 'ui.loop' module.
+"""
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+
+# module under test
+from conntextual.ui.loop import LoopMetrics
+
+
+def test_loop_metrics_basic():
+    """Test event-loop metrics updates."""
+
+    env = ChannelEnvironment()
+    metrics = LoopMetrics.create()
+    metrics.register(env)
+    env.finalize()
+
+    metrics.update(1.0, 5)
+    assert env.value("pending_tasks") == 5
+    assert env.value("scheduling_lag_ms") == 1.0
+    assert env.value("slow_callbacks") == 0
+
+    # Lag past the threshold counts as a slow callback.
+    env.set("slow_callback_ms", 10.0)
+    metrics.update(20.0, 5)
+    assert env.value("slow_callbacks") == 1
+    assert env.value("scheduling_lag_max_ms") == 20.0
@@ -0,0 +1,86 @@
+"""
+Test the 'ui.overview' module.
+"""
+
+# built-in
+import logging
+
+# third-party
+from pytest import approx
+from runtimepy.channel.environment import ChannelEnvironment
+
+# module under test
+from conntextual.ui.channel.pattern import PatternPair
+from conntextual.ui.overview import FleetOverview
+
+
+def node(rate: float, extra: bool = False) -> ChannelEnvironment:
+    """Create a channel environment for a node."""
+
+    env = ChannelEnvironment()
+    env.float_channel("rx.rate")
+    env.float_channel("tx.rate")
+    env.set("rx.rate", rate)
+    if extra:
+        env.float_channel("extra.rate")
+    return env
+
+
+def test_fleet_overview_basic():
+    """Test statistics of channels across environments."""
+
+    rates = [10.0] * 19 + [100.0]
+    nodes = [node(rate, extra=idx == 0) for idx, rate in enumerate(rates)]
+
+    overview = FleetOverview(
+        [(idx + 2, env) for idx, env in enumerate(nodes)],
+        PatternPair.from_dict({"include": "rate$", "exclude": "^tx"}),
+        logging.getLogger(__name__),
+    )
+    assert overview.values.names == ["rx.rate", "extra.rate"]
+
+    env = overview.command.env
+    overview.update()
+
+    assert env.value("environments") == 20
+    assert env.value("rx.rate.count") == 20
+    assert env.value("rx.rate.minimum") == 10.0
+    assert env.value("rx.rate.maximum") == 100.0
+    assert env.value("rx.rate.mean") == 14.5
+    assert env.value("rx.rate.std") == approx(19.615, abs=1e-3)
+
+    # The last node is an outlier (its tab is the last one).
+    assert env.value("rx.rate.outliers") == 1
+    assert env.value("rx.rate.worst_tab") == 21
+
+    # Only one node has this channel (so it has no outliers).
+    assert env.value("extra.rate.count") == 1
+    assert env.value("extra.rate.outliers") == 0
+    assert env.value("extra.rate.worst_tab") == 0
+
+    # Raising the threshold removes the outlier.
+    env.set("outlier_threshold", 5.0)
+    overview.update()
+    assert env.value("rx.rate.outliers") == 0
+    assert env.value("rx.rate.worst_tab") == 21
+
+
+def test_fleet_overview_empty():
+    """Test an overview without matching channels."""
+
+    overview = FleetOverview(
+        [(1, node(1.0))],
+        PatternPair.from_dict({"include": "nothing"}),
+        logging.getLogger(__name__),
+    )
+    assert not overview.values.names
+    assert overview.statistics == []
+
+    # Nothing is updated (and no statistics channels are created).
+    overview.update()
+    assert overview.statistics == []
+
+    env = overview.command.env
+    assert env.value("environments") == 1
+    assert env.value("outlier_threshold") == approx(3.0)
+    assert not any(x.endswith(".mean") for x in env.names)
@@ -0,0 +1,33 @@
+"""
+Test the 'ui.rate' module.
+"""
+
+# module under test
+from conntextual.ui.rate import FrameRateController
+
+
+def test_frame_rate_controller_basic():
+    """Test frame-period adaptation."""
+
+    controller = FrameRateController(
+        period_s=0.1, min_period_s=0.01, max_period_s=1.0, cpu_budget=0.5
+    )
+
+    # Periods shorten when plotted channels update rapidly (down to the
+    # minimum).
+    assert controller.update(0.1, 0.0, 0, 4) == 0.05
+    assert controller.update(0.015, 0.0, 0, 4) == 0.01
+
+    # Periods settle back to the configured period while frames change
+    # things.
+    assert controller.update(0.1, 0.0, 10, 1) == 0.1
+    assert controller.update(1.0, 0.0, 10, 0) == 0.55
+    assert controller.update(0.02, 0.0, 0, 1) == 0.06
+
+    # Periods lengthen while idle (up to the maximum).
+    assert controller.update(0.1, 0.0, 0, 0) > 0.1
+    assert controller.update(0.9, 0.0, 0, 0) == 1.0
+
+    # The CPU budget is always respected.
+    assert controller.update(0.1, 0.2, 0, 4) == 0.4
+    assert controller.update(1.0, 1.0, 0, 0) == 2.0
@@ -0,0 +1,28 @@
+"""
+Test the 'ui.synthetic' module.
+"""
+
+# third-party
+from runtimepy.channel.environment import ChannelEnvironment
+
+# module under test
+from conntextual.ui.synthetic import (
+    GROUP_ROWS,
+    synthetic_env,
+    update_primitive,
+)
+
+
+def test_synthetic_env_basic():
+    """Test creating and updating a synthetic environment."""
+
+    env = ChannelEnvironment()
+    primitives = synthetic_env(env, 100)
+    env.finalize()
+
+    names = list(env.names)
+    assert 100 <= len(names) < 100 + GROUP_ROWS
+
+    for primitive in primitives:
+        update_primitive(primitive)
+    assert 0 <= env.value("0.field") < 16  # type: ignore